@@ -866,26 +866,38 @@ Save the final documentation to: {}"#,
 
 /// Extract YAML from markdown code blocks
 fn extract_yaml(text: &str) -> String {
-    if text.contains("```yaml") {
-        let yaml_start = text.find("```yaml").unwrap() + 7;
-        let yaml_end = text[yaml_start..].find("```").unwrap() + yaml_start;
-        text[yaml_start..yaml_end].trim().to_string()
-    } else if text.contains("```") {
-        let yaml_start = text.find("```").unwrap() + 3;
-        let yaml_end = text[yaml_start..].find("```").unwrap() + yaml_start;
-        text[yaml_start..yaml_end].trim().to_string()
-    } else {
-        text.trim().to_string()
+    // Locate each fence once; a missing closing fence takes the rest
+    let body = text
+        .find("```yaml")
+        .map(|start| &text[start + 7..])
+        .or_else(|| text.find("```").map(|start| &text[start + 3..]));
+
+    match body {
+        Some(body) => body
+            .find("```")
+            .map_or(body, |end| &body[..end])
+            .trim()
+            .to_string(),
+        None => text.trim().to_string(),
     }
 }
 
 /// Load file content or return literal string
 async fn load_prompt_file(file_path: &str) -> anyhow::Result<String> {
-    let path = Path::new(file_path);
-    if path.exists() && path.is_file() {
-        Ok(fs::read_to_string(path).await?)
-    } else {
-        Ok(file_path.to_string())
+    // One read attempt instead of exists() + is_file() + read
+    match fs::read_to_string(file_path).await {
+        Ok(content) => Ok(content),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(file_path.to_string()),
+        // Only an unreadable regular file is an error; any other path is a
+        // literal prompt
+        Err(e) => match fs::metadata(file_path).await {
+            Ok(metadata) if metadata.is_file() => Err(anyhow::anyhow!(
+                "Failed to read prompt file {}: {}",
+                file_path,
+                e
+            )),
+            _ => Ok(file_path.to_string()),
+        },
     }
 }
 
@@ -969,8 +981,10 @@ async fn main() -> anyhow::Result<()> {
             anyhow::anyhow!("Phase 0 must run before Phase 1, or provide --analysis-file")
         })?;
 
-        let prompt_writer = load_prompt_file(args.system_prompt.as_ref().unwrap()).await?;
-        let output_style = load_prompt_file(args.append.as_ref().unwrap()).await?;
+        let (prompt_writer, output_style) = tokio::try_join!(
+            load_prompt_file(args.system_prompt.as_ref().unwrap()),
+            load_prompt_file(args.append.as_ref().unwrap()),
+        )?;
 
         let prompts = generate_prompts(
             args.input.as_ref().unwrap(),
@@ -3,6 +3,7 @@ use claude_agent_sdk::{
 };
 use futures::StreamExt;
 use serde::{Deserialize, Serialize};
+use std::fmt::Write as _;
 use std::path::{Path, PathBuf};
 use tokio::fs;
 
@@ -30,34 +31,32 @@ struct ResearchResult {
 
 /// Clean YAML response by removing markdown code blocks, prose, and document separators
 fn clean_yaml(text: &str) -> anyhow::Result<String> {
-    // Step 1: Extract from markdown code blocks if present (like tasks_agent.rs)
-    let mut yaml = if text.contains("```yaml") {
-        let start = text.find("```yaml").unwrap() + 7;
-        let end = text[start..].find("```").unwrap() + start;
-        text[start..end].trim().to_string()
-    } else if text.contains("```") {
-        let start = text.find("```").unwrap() + 3;
-        let end = text[start..].find("```").unwrap() + start;
-        text[start..end].trim().to_string()
-    } else {
-        text.trim().to_string()
-    };
+    // Step 1: Extract from markdown code blocks if present, locating each
+    // fence with a single search and borrowing the body instead of copying it
+    let yaml = text
+        .find("```yaml")
+        .map(|start| &text[start + 7..])
+        .or_else(|| text.find("```").map(|start| &text[start + 3..]))
+        .map(|rest| rest.split_once("```").map_or(rest, |(body, _)| body))
+        .unwrap_or(text)
+        .trim();
 
     // Step 2: Find where actual YAML starts (look for "objective:")
     // This handles prose text like "Perfect! Now I have all the data..."
-    if let Some(obj_pos) = yaml.find("objective:") {
-        yaml = yaml[obj_pos..].to_string();
-    } else {
-        // No "objective:" found - agent likely generated prose instead of YAML
-        return Err(anyhow::anyhow!(
-            "Could not find 'objective:' in response. The agent appears to have generated explanatory text instead of YAML.\n\nFirst 500 chars of response:\n{}",
-            &text.chars().take(500).collect::<String>()
-        ));
-    }
+    let yaml = match yaml.find("objective:") {
+        Some(obj_pos) => &yaml[obj_pos..],
+        None => {
+            // No "objective:" found - agent likely generated prose instead of YAML
+            return Err(anyhow::anyhow!(
+                "Could not find 'objective:' in response. The agent appears to have generated explanatory text instead of YAML.\n\nFirst 500 chars of response:\n{}",
+                &text.chars().take(500).collect::<String>()
+            ));
+        }
+    };
 
     // Step 3: Strip YAML document separators (---)
     // These cause "multiple documents" errors in serde_yaml::from_str
-    yaml = yaml.replace("---", "");
+    let yaml = yaml.replace("---", "");
 
     // Step 4: Return cleaned YAML
     Ok(yaml.trim().to_string())
@@ -195,34 +194,11 @@ async fn execute_research_prompt(prompt: &ResearchPrompt) -> anyhow::Result<Rese
     })
 }
 
-/// Phase 3: Synthesize all research into comprehensive documentation
-async fn synthesize_documentation(
-    objective: &str,
-    research_results: &[ResearchResult],
-    output_path: &Path,
-) -> anyhow::Result<()> {
-    println!("\n{}", "=".repeat(80));
-    println!("PHASE 3: Synthesizing Documentation");
-    println!("{}", "=".repeat(80));
-
-    // Build context from all research results
-    let mut research_context = format!(
-        "# Research Objective\n{}\n\n# Research Findings\n\n",
-        objective
-    );
-
-    for (i, result) in research_results.iter().enumerate() {
-        research_context.push_str(&format!(
-            "## Finding {}: {}\n\n**Query:** {}\n\n**Response:**\n{}\n\n---\n\n",
-            i + 1,
-            result.title,
-            result.query,
-            result.response
-        ));
-    }
+/// Start the synthesis prompt; findings are appended as research completes
+fn start_synthesis_prompt(objective: &str) -> anyhow::Result<String> {
+    let mut synthesis_prompt = String::with_capacity(objective.len() + 1024);
 
-    // Setup synthesis prompt
-    let synthesis_prompt = format!(
+    synthesis_prompt.push_str(
         r#"Based on the research findings below, create a comprehensive documentation that:
 
 1. Synthesizes all findings into a cohesive narrative
@@ -231,12 +207,48 @@ async fn synthesize_documentation(
 4. Organizes information logically with proper sections
 5. Serves as both user documentation and agent context
 
-{}
+"#,
+    );
+    write!(
+        synthesis_prompt,
+        "# Research Objective\n{}\n\n# Research Findings\n\n",
+        objective
+    )?;
+
+    Ok(synthesis_prompt)
+}
+
+/// Render one finding into the synthesis prompt
+///
+/// Called as soon as each research prompt finishes, so the raw response can
+/// be dropped instead of keeping every result alive until Phase 3.
+fn push_finding(
+    synthesis_prompt: &mut String,
+    finding_number: usize,
+    result: &ResearchResult,
+) -> anyhow::Result<()> {
+    write!(
+        synthesis_prompt,
+        "## Finding {}: {}\n\n**Query:** {}\n\n**Response:**\n{}\n\n---\n\n",
+        finding_number, result.title, result.query, result.response
+    )?;
+    Ok(())
+}
+
+/// Phase 3: Synthesize all research into comprehensive documentation
+async fn synthesize_documentation(
+    mut synthesis_prompt: String,
+    output_path: &Path,
+) -> anyhow::Result<()> {
+    println!("\n{}", "=".repeat(80));
+    println!("PHASE 3: Synthesizing Documentation");
+    println!("{}", "=".repeat(80));
 
-Generate a well-structured markdown document and save it to {}"#,
-        research_context,
+    write!(
+        synthesis_prompt,
+        "\n\nGenerate a well-structured markdown document and save it to {}",
         output_path.display()
-    );
+    )?;
 
     // Create options for synthesis
     let options = ClaudeAgentOptions::builder()
@@ -269,11 +281,20 @@ Generate a well-structured markdown document and save it to {}"#,
 
 /// Load file content or return literal string
 async fn load_prompt_file(file_path: &str) -> anyhow::Result<String> {
-    let path = Path::new(file_path);
-    if path.exists() && path.is_file() {
-        Ok(fs::read_to_string(path).await?)
-    } else {
-        Ok(file_path.to_string())
+    // One read attempt instead of exists() + is_file() + read
+    match fs::read_to_string(file_path).await {
+        Ok(content) => Ok(content),
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => Ok(file_path.to_string()),
+        // Only an unreadable regular file is an error; any other path is a
+        // literal prompt
+        Err(e) => match fs::metadata(file_path).await {
+            Ok(metadata) if metadata.is_file() => Err(anyhow::anyhow!(
+                "Failed to read prompt file {}: {}",
+                file_path,
+                e
+            )),
+            _ => Ok(file_path.to_string()),
+        },
     }
 }
 
@@ -299,8 +320,10 @@ async fn main() -> anyhow::Result<()> {
     });
 
     // Load prompts
-    let prompt_writer = load_prompt_file(prompt_writer_path).await?;
-    let output_style = load_prompt_file(output_style_path).await?;
+    let (prompt_writer, output_style) = tokio::try_join!(
+        load_prompt_file(prompt_writer_path),
+        load_prompt_file(output_style_path),
+    )?;
 
     // Phase 1: Generate prompts
     let prompts_data = generate_prompts(objective, &prompt_writer, &output_style).await?;
@@ -315,8 +338,9 @@ async fn main() -> anyhow::Result<()> {
         prompts_data.prompts.len()
     );
 
-    // Phase 2: Execute research prompts sequentially
-    let mut research_results = Vec::new();
+    // Phase 2: Execute research prompts sequentially, rendering each finding
+    // into the synthesis prompt as it completes
+    let mut synthesis_prompt = start_synthesis_prompt(objective)?;
 
     for (i, prompt) in prompts_data.prompts.iter().enumerate() {
         println!(
@@ -325,11 +349,11 @@ async fn main() -> anyhow::Result<()> {
             prompts_data.prompts.len()
         );
         let result = execute_research_prompt(prompt).await?;
-        research_results.push(result);
+        push_finding(&mut synthesis_prompt, i + 1, &result)?;
     }
 
     // Phase 3: Synthesize documentation
-    synthesize_documentation(objective, &research_results, &output_file).await?;
+    synthesize_documentation(synthesis_prompt, &output_file).await?;
 
     println!("\n{}", "=".repeat(80));
     println!(
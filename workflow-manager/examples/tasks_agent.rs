@@ -40,6 +40,7 @@
 │ FEATURES:                                                                    │
 │ • Resume from any phase (--overview-file, --tasks-file)                     │
 │ • Concurrent execution (--batch-size N for parallel expansion/review)      │
+│ • Bounded review concurrency (--max-concurrency N, default 4)               │
 │ • Phase selection (--phases 0,1,2)                                          │
 │ • AI or simple batching (--simple-batching for fixed-size batches)         │
 │ • Stream mode (--stream to write tasks incrementally)                      │
@@ -94,7 +95,7 @@ EXAMPLE COMMANDS:
 
 use clap::Parser;
 use claude_agent_sdk::{query, AgentDefinition, ClaudeAgentOptions, ContentBlock, Message};
-use futures::{stream::FuturesUnordered, StreamExt};
+use futures::{stream::FuturesUnordered, Stream, StreamExt};
 use serde::{Deserialize, Serialize};
 use std::io::{self, Write};
 use std::{
@@ -106,6 +107,35 @@ use tokio::{
     sync::{RwLock, Semaphore},
 };
 
+/// Sub-agent status markers: (agent, keyword, cues). A streamed line is
+/// attributed to `agent` when it contains `keyword` and any of the `cues`.
+const SUB_AGENT_MARKERS: [(&str, &str, &[&str]); 4] = [
+    ("files", "files", &["agent", "specialist", "@files"]),
+    (
+        "functions",
+        "functions",
+        &["agent", "specialist", "@functions"],
+    ),
+    ("formal", "formal", &["verification", "agent", "@formal"]),
+    ("tests", "test", &["agent", "specialist", "@tests"]),
+];
+
+/// Sub-agents mentioned in `line` as `@name`, found in a single pass over its
+/// `@` characters rather than one substring search per agent
+fn mentioned_sub_agents(line: &str) -> impl Iterator<Item = &'static str> + '_ {
+    line.match_indices('@').filter_map(|(at, _)| {
+        let rest = &line[at + 1..];
+        SUB_AGENT_MARKERS
+            .into_iter()
+            .map(|(agent, _, _)| agent)
+            .find(|agent| {
+                rest.strip_prefix(agent).is_some_and(|after| {
+                    !after.starts_with(|c: char| c.is_alphanumeric() || c == '_')
+                })
+            })
+    })
+}
+
 /// Shared state for live task display
 #[derive(Clone)]
 struct TaskLogger {
@@ -125,12 +155,11 @@ impl TaskLogger {
 
     async fn update(&self, line: &str) {
         // Check if this line mentions a sub-agent
-        let agent_names = ["@files", "@functions", "@formal", "@tests"];
-        for agent_name in &agent_names {
-            if line.contains(agent_name) {
-                let mut agents = self.sub_agents.write().await;
-                let clean_name = agent_name.trim_start_matches('@');
-                agents.insert(clean_name.to_string(), line.to_string());
+        let mut mentioned = mentioned_sub_agents(line).peekable();
+        if mentioned.peek().is_some() {
+            let mut agents = self.sub_agents.write().await;
+            for agent_name in mentioned {
+                agents.insert(agent_name.to_string(), line.to_string());
             }
         }
 
@@ -268,6 +297,10 @@ struct Args {
     #[arg(long)]
     batch_size: Option<usize>,
 
+    /// Maximum number of review batches running at once (Phase 2)
+    #[arg(long, default_value = "4")]
+    max_concurrency: usize,
+
     /// Comma-separated phases to execute (0=overview, 1=expand, 2=review)
     #[arg(long, default_value = "0,1,2")]
     phases: String,
@@ -344,24 +377,7 @@ Make sure to just give your response. You must not create or write any files jus
         .build();
 
     let stream = query(&prompt, Some(options)).await?;
-    let mut stream = Box::pin(stream);
-
-    let mut response_text = String::new();
-
-    while let Some(message) = stream.next().await {
-        match message? {
-            Message::Assistant { message, .. } => {
-                for block in &message.content {
-                    if let ContentBlock::Text { text } = block {
-                        println!("{}", text);
-                        response_text.push_str(text);
-                    }
-                }
-            }
-            Message::Result { .. } => break,
-            _ => {}
-        }
-    }
+    let response_text = collect_text(stream, true).await?;
 
     println!("\n");
     Ok(clean_yaml(&response_text))
@@ -529,10 +545,6 @@ Output valid YAML only, no markdown."#
     let agents_json = serde_json::to_string(&agents_map)?;
     let mut extra_args = std::collections::HashMap::new();
     extra_args.insert("agents".to_string(), Some(agents_json));
-    extra_args.insert(
-        "include-partial-messages".to_string(),
-        Some("true".to_string()),
-    );
 
     // System prompt for suborchestrator
     let system_prompt = format!(
@@ -620,7 +632,6 @@ IMPORTANT: Run all agents in parallel for maximum efficiency:
         .build();
 
     options.extra_args = extra_args;
-    options.include_partial_messages = true;
 
     let stream = query(&query_prompt, Some(options)).await?;
     let mut stream = Box::pin(stream);
@@ -636,61 +647,23 @@ IMPORTANT: Run all agents in parallel for maximum efficiency:
                             response_text.push_str(text);
                             // Update logger with last non-empty line and detect sub-agent mentions
                             if let Some(ref log) = logger {
-                                let text_lower = text.to_lowercase();
-
                                 // Parse each line to capture agent-specific messages
                                 for line in text.lines() {
                                     let line_lower = line.to_lowercase();
 
                                     // Match agent-specific output patterns
                                     // Looking for lines mentioning agent names or delegation
-                                    if line_lower.contains("files")
-                                        && (line_lower.contains("agent")
-                                            || line_lower.contains("specialist")
-                                            || line_lower.contains("@files"))
-                                    {
-                                        let msg = if line.len() > 60 {
-                                            format!("{}...", &line[..57])
-                                        } else {
-                                            line.to_string()
-                                        };
-                                        log.update_sub_agent("files", &msg).await;
-                                    }
-                                    if line_lower.contains("functions")
-                                        && (line_lower.contains("agent")
-                                            || line_lower.contains("specialist")
-                                            || line_lower.contains("@functions"))
-                                    {
-                                        let msg = if line.len() > 60 {
-                                            format!("{}...", &line[..57])
-                                        } else {
-                                            line.to_string()
-                                        };
-                                        log.update_sub_agent("functions", &msg).await;
-                                    }
-                                    if line_lower.contains("formal")
-                                        && (line_lower.contains("verification")
-                                            || line_lower.contains("agent")
-                                            || line_lower.contains("@formal"))
-                                    {
-                                        let msg = if line.len() > 60 {
-                                            format!("{}...", &line[..57])
-                                        } else {
-                                            line.to_string()
-                                        };
-                                        log.update_sub_agent("formal", &msg).await;
-                                    }
-                                    if line_lower.contains("test")
-                                        && (line_lower.contains("agent")
-                                            || line_lower.contains("specialist")
-                                            || line_lower.contains("@tests"))
-                                    {
-                                        let msg = if line.len() > 60 {
-                                            format!("{}...", &line[..57])
-                                        } else {
-                                            line.to_string()
-                                        };
-                                        log.update_sub_agent("tests", &msg).await;
+                                    for (agent, keyword, cues) in SUB_AGENT_MARKERS {
+                                        if line_lower.contains(keyword)
+                                            && cues.iter().any(|cue| line_lower.contains(cue))
+                                        {
+                                            let msg = if line.len() > 60 {
+                                                format!("{}...", &line[..57])
+                                            } else {
+                                                line.to_string()
+                                            };
+                                            log.update_sub_agent(agent, &msg).await;
+                                        }
                                     }
                                 }
 
@@ -840,10 +813,11 @@ fn generate_simple_batches(tasks: &[TaskOverview], batch_size: usize) -> Vec<Vec
     println!("Batch Planning: Simple batching with size={}", batch_size);
     println!("{}", "=".repeat(80));
 
-    let mut batches = Vec::new();
-    for chunk in tasks.chunks(batch_size) {
-        batches.push(chunk.to_vec());
-    }
+    // A batch size of 0 would make `chunks` panic; treat it as 1
+    let batches: Vec<Vec<TaskOverview>> = tasks
+        .chunks(batch_size.max(1))
+        .map(<[TaskOverview]>::to_vec)
+        .collect();
 
     println!("Created {} batch(es)", batches.len());
     batches
@@ -896,23 +870,7 @@ Output only the YAML, no markdown formatting."#,
         .build();
 
     let stream = query(&prompt, Some(options)).await?;
-    let mut stream = Box::pin(stream);
-
-    let mut response_text = String::new();
-
-    while let Some(message) = stream.next().await {
-        match message? {
-            Message::Assistant { message, .. } => {
-                for block in &message.content {
-                    if let ContentBlock::Text { text } = block {
-                        response_text.push_str(text);
-                    }
-                }
-            }
-            Message::Result { .. } => break,
-            _ => {}
-        }
-    }
+    let response_text = collect_text(stream, false).await?;
 
     let yaml_content = clean_yaml(&response_text);
     let plan_wrapper: serde_yaml::Value = serde_yaml::from_str(&yaml_content)?;
@@ -954,6 +912,7 @@ async fn review_tasks(
     impl_md: &str,
     task_template: &str,
     batch_size: usize,
+    max_concurrency: usize,
 ) -> anyhow::Result<Vec<ReviewResult>> {
     println!("\n{}", "=".repeat(80));
     println!("PHASE 2: Batched Review - Validate Tasks");
@@ -980,18 +939,22 @@ async fn review_tasks(
         batch_size
     );
 
-    let mut all_results = Vec::new();
-
-    for (batch_num, batch) in batches.iter().enumerate() {
-        println!(
-            "\n→ Processing Review Batch {}/{}",
-            batch_num + 1,
-            batches.len()
-        );
+    // Run up to max_concurrency batches at once; results stay in batch order
+    let num_batches = batches.len();
+    let mut reviews = futures::stream::iter(batches.into_iter().enumerate())
+        .map(|(batch_num, batch)| async move {
+            println!(
+                "\n→ Processing Review Batch {}/{}",
+                batch_num + 1,
+                num_batches
+            );
+            review_batch(batch, impl_md, task_template, batch_num + 1).await
+        })
+        .buffered(max_concurrency.max(1));
 
-        let result = review_batch(batch, impl_md, task_template, batch_num + 1).await?;
-
-        all_results.extend(result);
+    let mut all_results = Vec::new();
+    while let Some(result) = reviews.next().await {
+        all_results.extend(result?);
     }
 
     Ok(all_results)
@@ -1041,21 +1004,20 @@ SUMMARY: [Brief summary]"#.to_string(),
     let agents_json = serde_json::to_string(&agents_map)?;
     let mut extra_args = std::collections::HashMap::new();
     extra_args.insert("agents".to_string(), Some(agents_json));
-    extra_args.insert(
-        "include-partial-messages".to_string(),
-        Some("true".to_string()),
-    );
 
     let task_list: Vec<_> = batch
         .iter()
         .map(|(overview, _)| format!("  - Task {}: {}", overview.task.id, overview.task.name))
         .collect();
 
+    // The system prompt is the same for every batch and the query prompt puts
+    // the shared IMPL.md and template ahead of the batch's task list, so all
+    // batches send one common prompt prefix the API can cache.
     let system_prompt = format!(
         r#"You are a review suborchestrator coordinating Step 2: Review & Validation.
 
 ## YOUR ROLE
-Coordinate the @reviewer agent to validate all {} tasks in your batch.
+Coordinate the @reviewer agent to validate all tasks in your batch.
 
 ## AVAILABLE CONTEXT
 - Implementation requirements (IMPL.md)
@@ -1088,12 +1050,11 @@ Output ONLY a valid JSON array with this exact structure:
 
 IMPORTANT:
 - Convert ASSESSMENT to success boolean (APPROVED=true, NEEDS_REVISION=false)
-- Output ONLY the JSON array, no markdown code blocks, no extra commentary"#,
-        batch.len()
+- Output ONLY the JSON array, no markdown code blocks, no extra commentary"#
     );
 
     let query_prompt = format!(
-        r#"Coordinate review of all {} tasks in your batch.
+        r#"Coordinate review of all tasks in your batch.
 
 ## CONTEXT
 
@@ -1108,7 +1069,7 @@ IMPORTANT:
 ```
 
 ## YOUR BATCH
-Review these tasks:
+Review these {} tasks:
 {}
 
 ## INSTRUCTIONS
@@ -1118,9 +1079,9 @@ For EACH task above:
 3. Parse the reviewer's response
 
 Run ALL @reviewer agents in PARALLEL, then combine results into JSON array."#,
-        batch.len(),
         impl_md,
         task_template,
+        batch.len(),
         task_list.join("\n")
     );
 
@@ -1131,26 +1092,9 @@ Run ALL @reviewer agents in PARALLEL, then combine results into JSON array."#,
         .build();
 
     options.extra_args = extra_args;
-    options.include_partial_messages = true;
 
     let stream = query(&query_prompt, Some(options)).await?;
-    let mut stream = Box::pin(stream);
-
-    let mut response_text = String::new();
-
-    while let Some(message) = stream.next().await {
-        match message? {
-            Message::Assistant { message, .. } => {
-                for block in &message.content {
-                    if let ContentBlock::Text { text } = block {
-                        response_text.push_str(text);
-                    }
-                }
-            }
-            Message::Result { .. } => break,
-            _ => {}
-        }
-    }
+    let response_text = collect_text(stream, false).await?;
 
     // Parse JSON response
     let json_content = extract_json(&response_text);
@@ -1227,34 +1171,87 @@ async fn generate_review_report(
     Ok(())
 }
 
+/// Drain an agent stream, collecting the text blocks of assistant messages
+///
+/// Stops at the result message. With `echo` set, each text block is also
+/// printed as it arrives.
+async fn collect_text(
+    stream: impl Stream<Item = claude_agent_sdk::error::Result<Message>>,
+    echo: bool,
+) -> anyhow::Result<String> {
+    let mut stream = Box::pin(stream);
+    let mut response_text = String::new();
+
+    while let Some(message) = stream.next().await {
+        match message? {
+            Message::Assistant { message, .. } => {
+                for block in &message.content {
+                    if let ContentBlock::Text { text } = block {
+                        if echo {
+                            println!("{}", text);
+                        }
+                        response_text.push_str(text);
+                    }
+                }
+            }
+            Message::Result { .. } => break,
+            _ => {}
+        }
+    }
+
+    Ok(response_text)
+}
+
+/// Return the body of the first code fence, preferring one opened with
+/// `tagged_fence` (e.g. "```yaml"), or the whole text if there is none
+///
+/// Each fence is located with a single `find`, and the body is borrowed
+/// from `text`. A missing closing fence takes the rest of the text.
+fn strip_code_fence<'a>(text: &'a str, tagged_fence: &str) -> &'a str {
+    let body = text
+        .find(tagged_fence)
+        .map(|start| &text[start + tagged_fence.len()..])
+        .or_else(|| text.find("```").map(|start| &text[start + 3..]));
+
+    match body {
+        Some(body) => body.find("```").map_or(body, |end| &body[..end]).trim(),
+        None => text.trim(),
+    }
+}
+
 /// Clean YAML response by removing markdown code blocks
 fn clean_yaml(text: &str) -> String {
-    if text.contains("```yaml") {
-        let start = text.find("```yaml").unwrap() + 7;
-        let end = text[start..].find("```").unwrap() + start;
-        text[start..end].trim().to_string()
-    } else if text.contains("```") {
-        let start = text.find("```").unwrap() + 3;
-        let end = text[start..].find("```").unwrap() + start;
-        text[start..end].trim().to_string()
-    } else {
-        text.trim().to_string()
-    }
+    strip_code_fence(text, "```yaml").to_string()
 }
 
 /// Extract JSON from markdown code blocks
 fn extract_json(text: &str) -> String {
-    if text.contains("```json") {
-        let start = text.find("```json").unwrap() + 7;
-        let end = text[start..].find("```").unwrap() + start;
-        text[start..end].trim().to_string()
-    } else if text.contains("```") {
-        let start = text.find("```").unwrap() + 3;
-        let end = text[start..].find("```").unwrap() + start;
-        text[start..end].trim().to_string()
-    } else {
-        text.trim().to_string()
+    strip_code_fence(text, "```json").to_string()
+}
+
+/// Load and combine the IMPL.md file(s)
+///
+/// All files are read concurrently. With more than one file, each is headed
+/// by its source path and separated by `---`.
+async fn load_impl_md(impl_files: &[String]) -> anyhow::Result<String> {
+    let mut contents =
+        futures::future::try_join_all(impl_files.iter().map(fs::read_to_string)).await?;
+
+    if contents.len() == 1 {
+        return Ok(contents.swap_remove(0));
     }
+
+    let mut impl_md = String::with_capacity(contents.iter().map(|c| c.len() + 64).sum());
+    for (i, (impl_file, content)) in impl_files.iter().zip(&contents).enumerate() {
+        if i > 0 {
+            impl_md.push_str("\n\n---\n\n");
+        }
+        impl_md.push_str("# Source: ");
+        impl_md.push_str(impl_file);
+        impl_md.push_str("\n\n");
+        impl_md.push_str(content);
+    }
+    Ok(impl_md)
 }
 
 /// Parse multi-document YAML
@@ -1280,6 +1277,7 @@ async fn main() -> anyhow::Result<()> {
     let mut tasks_overview_yaml = String::new();
     let mut tasks_overview: Vec<TaskOverview> = Vec::new();
     let mut tasks_details: Vec<TaskDetail> = Vec::new();
+    let mut loaded_impl_md: Option<String> = None;
 
     // Phase 0: Generate task overview
     if phases_to_run.contains(&0) {
@@ -1291,22 +1289,14 @@ async fn main() -> anyhow::Result<()> {
         }
 
         // Load IMPL.md file(s)
-        let mut impl_parts = Vec::new();
-        for impl_file in &args.impl_files {
-            let content = fs::read_to_string(impl_file).await?;
-            if args.impl_files.len() > 1 {
-                impl_parts.push(format!("# Source: {}\n\n{}", impl_file, content));
-            } else {
-                impl_parts.push(content);
-            }
-        }
-        let impl_md = impl_parts.join("\n\n---\n\n");
+        let impl_md = load_impl_md(&args.impl_files).await?;
 
         // Load overview template
         let overview_template = fs::read_to_string(args.overview_template.unwrap()).await?;
 
         // Generate overview
         tasks_overview_yaml = generate_overview(&impl_md, &overview_template).await?;
+        loaded_impl_md = Some(impl_md);
 
         // Save to file
         let timestamp = chrono::Local::now().format("%Y%m%d_%H%M%S");
@@ -1363,7 +1353,8 @@ async fn main() -> anyhow::Result<()> {
 
         // Execute batches
         let sem = Arc::new(Semaphore::new(concurrency));
-        let mut all_expanded = Vec::new();
+        // Expanded tasks are appended as they finish, `---`-separated
+        let mut tasks_yaml = String::new();
 
         for (batch_num, batch) in batches.iter().enumerate() {
             println!("\n→ Executing Batch {}/{}", batch_num + 1, batches.len());
@@ -1409,7 +1400,11 @@ async fn main() -> anyhow::Result<()> {
             });
 
             while let Some(result) = tasks.next().await {
-                all_expanded.push(result?);
+                let expanded = result?;
+                if !tasks_yaml.is_empty() {
+                    tasks_yaml.push_str("\n---\n");
+                }
+                tasks_yaml.push_str(&expanded);
             }
 
             // Cancel display task and show final status
@@ -1419,7 +1414,6 @@ async fn main() -> anyhow::Result<()> {
         }
 
         // Save tasks
-        let tasks_yaml = all_expanded.join("\n---\n");
         let timestamp = chrono::Local::now().format("%Y%m%d_%H%M%S");
         let tasks_path = args
             .output
@@ -1455,17 +1449,11 @@ async fn main() -> anyhow::Result<()> {
             anyhow::bail!("--task-template is required when running phase 2");
         }
 
-        // Load IMPL.md
-        let mut impl_parts = Vec::new();
-        for impl_file in &args.impl_files {
-            let content = fs::read_to_string(impl_file).await?;
-            if args.impl_files.len() > 1 {
-                impl_parts.push(format!("# Source: {}\n\n{}", impl_file, content));
-            } else {
-                impl_parts.push(content);
-            }
-        }
-        let impl_md = impl_parts.join("\n\n---\n\n");
+        // Load IMPL.md, reusing the copy from phase 0 if it ran
+        let impl_md = match loaded_impl_md.take() {
+            Some(impl_md) => impl_md,
+            None => load_impl_md(&args.impl_files).await?,
+        };
 
         let task_template = fs::read_to_string(args.task_template.as_ref().unwrap()).await?;
 
@@ -1476,6 +1464,7 @@ async fn main() -> anyhow::Result<()> {
             &impl_md,
             &task_template,
             review_batch_size,
+            args.max_concurrency,
         )
         .await?;
 
@@ -20,8 +20,10 @@ use serde::{Deserialize, Serialize};
 use serde_json::json;
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
+use std::sync::{Mutex, OnceLock};
 use std::time::Duration;
 use tokio::fs;
+use tokio::task::JoinSet;
 
 // ============================================================================
 // CLI Arguments
@@ -72,14 +74,14 @@ async fn load_mcp_config(
     // Find .mcp.json in parent directory
     let mcp_config_path = Path::new("./.mcp.json");
 
-    let content = fs::read_to_string(mcp_config_path).await.map_err(|e| {
+    let content = fs::read(mcp_config_path).await.map_err(|e| {
         anyhow::anyhow!(
             "Failed to read MCP config at {}: {}",
             mcp_config_path.display(),
             e
         )
     })?;
-    let config: McpConfig = serde_json::from_str(&content)?;
+    let config: McpConfig = serde_json::from_slice(&content)?;
 
     let mut mcp_servers = HashMap::new();
     let mut allowed_tools = Vec::new();
@@ -104,16 +106,41 @@ async fn load_mcp_config(
 // TTS Tool (ElevenLabs)
 // ============================================================================
 
+/// Shared HTTP client so repeated notifications reuse pooled connections
+/// instead of paying a TCP + TLS handshake each time
+fn tts_client() -> &'static reqwest::Client {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    CLIENT.get_or_init(reqwest::Client::new)
+}
+
+/// Held for the whole of each clip so notifications play one at a time, in
+/// the order they were raised, instead of talking over each other
+fn tts_playback_lock() -> &'static tokio::sync::Mutex<()> {
+    static LOCK: OnceLock<tokio::sync::Mutex<()>> = OnceLock::new();
+    LOCK.get_or_init(|| tokio::sync::Mutex::new(()))
+}
+
+/// Notification clips playing in the background, awaited before exit so the
+/// last one is not cut off
+fn pending_notifications() -> &'static Mutex<JoinSet<()>> {
+    static PENDING: OnceLock<Mutex<JoinSet<()>>> = OnceLock::new();
+    PENDING.get_or_init(|| Mutex::new(JoinSet::new()))
+}
+
 async fn play_tts(message: &str) -> anyhow::Result<String> {
     let api_key = std::env::var("ELEVENLABS_API_KEY")
         .map_err(|_| anyhow::anyhow!("ELEVENLABS_API_KEY not found in environment"))?;
 
+    let _playback = tts_playback_lock().lock().await;
     println!("🔊 Playing TTS: {}", message);
 
-    let client = reqwest::Client::new();
+    let client = tts_client();
 
-    let response = client
-        .post("https://api.elevenlabs.io/v1/text-to-speech/vGQNBgLaiM3EdZtxIiuY")
+    // Use the streaming endpoint with a low-bitrate format so audio starts
+    // arriving while the rest is still being synthesised
+    let mut response = client
+        .post("https://api.elevenlabs.io/v1/text-to-speech/vGQNBgLaiM3EdZtxIiuY/stream")
+        .query(&[("output_format", "mp3_22050_32")])
         .header("xi-api-key", &api_key)
         .json(&json!({
             "text": message,
@@ -136,42 +163,73 @@ async fn play_tts(message: &str) -> anyhow::Result<String> {
         ));
     }
 
-    // Get audio bytes
-    let audio_bytes = response.bytes().await?;
-
-    // Write to temp file
-    let temp_path = std::env::temp_dir().join("tts_output.mp3");
-    fs::write(&temp_path, audio_bytes).await?;
-
     // Play audio (platform-specific)
     #[cfg(target_os = "linux")]
     {
-        tokio::process::Command::new("mpg123")
-            .arg(&temp_path)
-            .output()
-            .await?;
+        use tokio::io::AsyncWriteExt;
+
+        // Pipe chunks into mpg123 as they arrive instead of buffering the
+        // whole MP3 and writing it to a temp file first
+        let mut player = tokio::process::Command::new("mpg123")
+            .args(["-q", "-"])
+            .stdin(std::process::Stdio::piped())
+            .spawn()?;
+        let mut stdin = player
+            .stdin
+            .take()
+            .ok_or_else(|| anyhow::anyhow!("Failed to open mpg123 stdin"))?;
+
+        while let Some(chunk) = response.chunk().await? {
+            stdin.write_all(&chunk).await?;
+        }
+        drop(stdin);
+        player.wait().await?;
     }
 
-    #[cfg(target_os = "macos")]
+    // afplay and SoundPlayer cannot read from stdin, so buffer to a temp file.
+    // Each clip gets its own file so concurrent runs never share one.
+    #[cfg(not(target_os = "linux"))]
     {
-        tokio::process::Command::new("afplay")
-            .arg(&temp_path)
-            .output()
-            .await?;
-    }
+        use std::sync::atomic::{AtomicU64, Ordering};
 
-    #[cfg(target_os = "windows")]
-    {
-        tokio::process::Command::new("powershell")
-            .args(&[
-                "-c",
-                &format!(
-                    "(New-Object Media.SoundPlayer '{}').PlaySync();",
-                    temp_path.display()
-                ),
-            ])
-            .output()
-            .await?;
+        static CLIP_COUNTER: AtomicU64 = AtomicU64::new(0);
+
+        let audio_bytes = response.bytes().await?;
+        let temp_path = std::env::temp_dir().join(format!(
+            "tts_output_{}_{}.mp3",
+            std::process::id(),
+            CLIP_COUNTER.fetch_add(1, Ordering::Relaxed)
+        ));
+        fs::write(&temp_path, audio_bytes).await?;
+
+        let played: anyhow::Result<()> = async {
+            #[cfg(target_os = "macos")]
+            {
+                tokio::process::Command::new("afplay")
+                    .arg(&temp_path)
+                    .output()
+                    .await?;
+            }
+
+            #[cfg(target_os = "windows")]
+            {
+                tokio::process::Command::new("powershell")
+                    .args(&[
+                        "-c",
+                        &format!(
+                            "(New-Object Media.SoundPlayer '{}').PlaySync();",
+                            temp_path.display()
+                        ),
+                    ])
+                    .output()
+                    .await?;
+            }
+
+            Ok(())
+        }
+        .await;
+        let _ = fs::remove_file(&temp_path).await;
+        played?;
     }
 
     Ok(format!("TTS played: {}", message))
@@ -270,16 +328,23 @@ fn notify_with_tts() -> claude_agent_sdk::types::HookCallback {
         );
         println!("└──────────────────────────────────────────┘");
 
-        if let Err(e) = play_tts(&message).await {
-            eprintln!("┌──────────────────────────────┐");
-            eprintln!("│ ❌ TTS Error                 │");
-            eprintln!("├──────────────────────────────┤");
-            eprintln!(
-                "│ {:<28} │",
-                e.to_string().chars().take(28).collect::<String>()
-            );
-            eprintln!("└──────────────────────────────┘");
-        }
+        // Play in the background so the hook returns immediately and the
+        // agent loop is not held up by the download and playback
+        let mut pending = pending_notifications().lock().unwrap();
+        while pending.try_join_next().is_some() {}
+        pending.spawn(async move {
+            if let Err(e) = play_tts(&message).await {
+                eprintln!("┌──────────────────────────────┐");
+                eprintln!("│ ❌ TTS Error                 │");
+                eprintln!("├──────────────────────────────┤");
+                eprintln!(
+                    "│ {:<28} │",
+                    e.to_string().chars().take(28).collect::<String>()
+                );
+                eprintln!("└──────────────────────────────┘");
+            }
+        });
+        drop(pending);
 
         Ok(HookOutput::default())
     })
@@ -560,5 +625,9 @@ async fn main() -> anyhow::Result<()> {
 
     client.close().await?;
 
+    // Let queued notifications finish, including the one for the final Stop
+    let mut pending = std::mem::take(&mut *pending_notifications().lock().unwrap());
+    while pending.join_next().await.is_some() {}
+
     Ok(())
 }
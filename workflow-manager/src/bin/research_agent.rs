@@ -18,7 +18,7 @@
   Phase 1: VALIDATE ANALYSIS
     │
     ├─> Input: codebase_analysis.yaml
-    ├─> Validate YAML structure with check_yaml.py
+    ├─> Validate YAML structure (in-process, serde_yaml)
     ├─> If invalid: Fix with Claude agent
     └─> Loop until valid
 
@@ -45,7 +45,7 @@
 
   Phase 4: VALIDATE & FIX YAML (loop until valid)
     │
-    ├─> Validate all result files with check_yaml.py
+    ├─> Validate all result files (in-process, serde_yaml)
     ├─> Identify files with errors
     └─> Loop:
         ├─> Fix broken files concurrently with Claude
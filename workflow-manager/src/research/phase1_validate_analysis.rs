@@ -4,15 +4,16 @@
 //!
 //! This phase:
 //! - Takes the codebase analysis from Phase 0
-//! - Validates its YAML structure using an external Python validator
-//! - If invalid, uses a Claude agent to fix the YAML
+//! - Validates its YAML syntax in-process with serde_yaml
+//! - If the syntax is invalid, uses a Claude agent to fix the YAML
 //! - Loops until the YAML is valid
 //! - Returns the validated codebase analysis
 //!
 //! This ensures Phase 2 receives valid, parseable YAML for prompt generation.
 
-use crate::research::phase4_validate::{execute_fix_yaml, validate_yaml_file};
+use crate::research::phase4_validate::execute_fix_yaml;
 use crate::research::types::CodebaseAnalysis;
+use crate::workflow_utils::{parse_yaml, validate_yaml_documents};
 use anyhow::{Context, Result};
 use tokio::fs;
 
@@ -47,20 +48,26 @@ pub async fn validate_codebase_analysis(
 
         println!("\n🔍 Validation attempt {}/{}", iteration, MAX_ITERATIONS);
 
-        // Validate the YAML file
-        let (_, is_valid, error_message) = validate_yaml_file(analysis_file_path)
+        // Read once per attempt; the same content is checked and loaded
+        let yaml_content = fs::read_to_string(analysis_file_path)
             .await
-            .with_context(|| {
-                format!(
-                    "Failed to validate YAML file: {}",
-                    analysis_file_path
-                )
-            })?;
+            .with_context(|| format!("Failed to read YAML file: {}", analysis_file_path))?;
 
-        if is_valid {
-            println!("✅ Codebase analysis YAML is valid!");
-            break;
-        }
+        // Only syntax errors go to the YAML fixer. Valid YAML that does not
+        // match the analysis schema is reported as is rather than rewritten.
+        let error_message = match validate_yaml_documents(&yaml_content) {
+            Ok(_) => {
+                let analysis: CodebaseAnalysis = parse_yaml(&yaml_content).with_context(|| {
+                    format!(
+                        "Failed to parse validated YAML file: {}",
+                        analysis_file_path
+                    )
+                })?;
+                println!("✅ Codebase analysis validated and loaded successfully");
+                return Ok(analysis);
+            }
+            Err(e) => format!("❌ Error in {}: {:#}", analysis_file_path, e),
+        };
 
         // YAML is invalid, attempt to fix it
         println!("❌ YAML validation failed");
@@ -75,26 +82,4 @@ pub async fn validate_codebase_analysis(
 
         println!("✓ Fix attempt completed, re-validating...");
     }
-
-    // Read and parse the validated YAML
-    let yaml_content = fs::read_to_string(analysis_file_path)
-        .await
-        .with_context(|| {
-            format!(
-                "Failed to read validated YAML file: {}",
-                analysis_file_path
-            )
-        })?;
-
-    let analysis: CodebaseAnalysis = serde_yaml::from_str(&yaml_content)
-        .with_context(|| {
-            format!(
-                "Failed to parse validated YAML file: {}",
-                analysis_file_path
-            )
-        })?;
-
-    println!("✅ Codebase analysis validated and loaded successfully");
-
-    Ok(analysis)
 }
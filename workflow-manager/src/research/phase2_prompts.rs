@@ -11,7 +11,7 @@
 //! The result is saved to `OUTPUT/research_prompts_<timestamp>.yaml` for use in Phase 3.
 
 use crate::research::types::{CodebaseAnalysis, PromptsData, ResearchPrompt};
-use crate::workflow_utils::{execute_agent, extract_yaml, AgentConfig};
+use crate::workflow_utils::{execute_agent, extract_yaml, parse_yaml, AgentConfig};
 use anyhow::Context;
 use claude_agent_sdk::ClaudeAgentOptions;
 
@@ -56,19 +56,7 @@ pub async fn generate_prompts(
 
     // Parse YAML flexibly first (like Python's yaml.safe_load)
     let prompts_yaml: serde_yaml::Value =
-        serde_yaml::from_str(&yaml_content).with_context(|| {
-            let error_msg = format!("Failed to parse prompts YAML");
-
-            // If duplicate key error, provide helpful context
-            if yaml_content.contains("duplicate") {
-                eprintln!("\n❌ YAML PARSING ERROR: Duplicate keys detected in prompts");
-                eprintln!("The prompts YAML contains duplicate keys which is invalid.");
-                eprintln!("\nGenerated YAML preview (first 500 chars):");
-                eprintln!("{}", &yaml_content.chars().take(500).collect::<String>());
-            }
-
-            error_msg
-        })?;
+        parse_yaml(&yaml_content).context("Failed to parse prompts YAML")?;
 
     // Extract fields with safe defaults
     let objective = prompts_yaml["objective"]
@@ -76,28 +64,29 @@ pub async fn generate_prompts(
         .unwrap_or("Unknown objective")
         .to_string();
 
-    let prompts_array = prompts_yaml["prompts"]
+    // Walk the parsed sequence in place rather than deep-cloning it first
+    let prompts: Vec<ResearchPrompt> = prompts_yaml["prompts"]
         .as_sequence()
-        .cloned()
-        .unwrap_or_default();
-
-    let prompts: Vec<ResearchPrompt> = prompts_array
-        .iter()
-        .filter_map(|p| {
-            Some(ResearchPrompt {
-                title: p["title"].as_str()?.to_string(),
-                query: p["query"].as_str()?.to_string(),
-                focus: p["focus"]
-                    .as_sequence()
-                    .map(|seq| {
-                        seq.iter()
-                            .filter_map(|f| f.as_str().map(String::from))
-                            .collect()
+        .map(|prompts_array| {
+            prompts_array
+                .iter()
+                .filter_map(|p| {
+                    Some(ResearchPrompt {
+                        title: p["title"].as_str()?.to_string(),
+                        query: p["query"].as_str()?.to_string(),
+                        focus: p["focus"]
+                            .as_sequence()
+                            .map(|seq| {
+                                seq.iter()
+                                    .filter_map(|f| f.as_str().map(String::from))
+                                    .collect()
+                            })
+                            .unwrap_or_default(),
                     })
-                    .unwrap_or_default(),
-            })
+                })
+                .collect()
         })
-        .collect();
+        .unwrap_or_default();
 
     let prompts_data = PromptsData { objective, prompts };
 
@@ -17,6 +17,10 @@ use anyhow::Context;
 use claude_agent_sdk::{ClaudeAgentOptions, SystemPrompt, SystemPromptPreset};
 use tokio::fs;
 
+/// Instructions appended to the claude_code preset for every research agent
+const RESEARCH_SYSTEM_PROMPT_APPEND: &str =
+    "IMPORTANT: DO NOT create or write any files. Output all your research findings as yaml only.";
+
 /// Execute all research prompts concurrently with configurable batch size
 pub async fn execute_research(
     prompts_data: &PromptsData,
@@ -83,10 +87,7 @@ pub async fn execute_research_prompt(
     let preset = SystemPromptPreset {
         prompt_type: "preset".to_string(),
         preset: "claude_code".to_string(),
-        append: Some(
-            "IMPORTANT: DO NOT create or write any files. Output all your research findings as yaml only."
-                .to_string(),
-        ),
+        append: Some(RESEARCH_SYSTEM_PROMPT_APPEND.to_string()),
     };
 
     let options = ClaudeAgentOptions::builder()
@@ -3,7 +3,7 @@
 //! Validates and automatically fixes YAML syntax errors in research results.
 //!
 //! This phase:
-//! - Validates all YAML files from Phase 3 using an external Python validator
+//! - Validates all YAML files from Phase 3 in-process with serde_yaml
 //! - Identifies files with syntax errors
 //! - Uses Claude agents to fix broken YAML files in parallel
 //! - Re-validates after each fix iteration
@@ -11,33 +11,40 @@
 //!
 //! Can run standalone on a directory of YAML files or as part of the full workflow.
 
-use crate::workflow_utils::{execute_agent, extract_yaml, AgentConfig};
+use crate::workflow_utils::{execute_agent, extract_yaml, validate_yaml_documents, AgentConfig};
 use anyhow::{Context, Result};
 use claude_agent_sdk::{ClaudeAgentOptions, SystemPrompt, SystemPromptPreset};
 use tokio::fs;
 
-/// Validate YAML file using check_yaml.py script
+/// Instructions appended to the claude_code preset for every YAML fixer
+const FIX_YAML_SYSTEM_PROMPT_APPEND: &str = "You are a YAML expert. Fix the YAML syntax errors and output ONLY valid YAML. Do not add explanations.";
+
+/// Validate a YAML file in-process
+///
+/// Every document in the file is parsed with serde_yaml. The returned message
+/// mirrors the old check_yaml.py output so the fix loop can pass it to the fixer.
+///
+/// Parsing runs on tokio's blocking pool, so when many files are validated
+/// concurrently they parse in parallel instead of one after another on the
+/// async task that polls them.
 pub async fn validate_yaml_file(file_path: &str) -> Result<(String, bool, String)> {
-    use tokio::process::Command;
-
-    let output = Command::new("uv")
-        .args([
-            "run",
-            "/home/molaco/Documents/japanese/SCRIPTS/check_yaml.py",
-            file_path,
-        ])
-        .output()
-        .await?;
-
-    let stdout = String::from_utf8_lossy(&output.stdout);
-    let stderr = String::from_utf8_lossy(&output.stderr);
-    let combined_output = format!("{}{}", stdout, stderr);
-
-    let is_valid = output.status.success()
-        && !combined_output.contains("❌")
-        && !combined_output.contains("Error");
-
-    Ok((file_path.to_string(), is_valid, combined_output))
+    let content = fs::read_to_string(file_path)
+        .await
+        .with_context(|| format!("Failed to read YAML file for validation: {}", file_path))?;
+
+    let validation = tokio::task::spawn_blocking(move || validate_yaml_documents(&content))
+        .await
+        .with_context(|| format!("YAML validation task failed: {}", file_path))?;
+
+    let (is_valid, output) = match validation {
+        Ok(count) => (
+            true,
+            format!("✅ {}: {} document(s) valid", file_path, count),
+        ),
+        Err(e) => (false, format!("❌ Error in {}: {:#}", file_path, e)),
+    };
+
+    Ok((file_path.to_string(), is_valid, output))
 }
 
 /// Fix invalid YAML file by querying Claude
@@ -85,7 +92,7 @@ Output the fixed YAML wrapped in ```yaml code blocks."#,
     let preset = SystemPromptPreset {
         prompt_type: "preset".to_string(),
         preset: "claude_code".to_string(),
-        append: Some("You are a YAML expert. Fix the YAML syntax errors and output ONLY valid YAML. Do not add explanations.".to_string()),
+        append: Some(FIX_YAML_SYSTEM_PROMPT_APPEND.to_string()),
     };
 
     let options = ClaudeAgentOptions::builder()
@@ -17,6 +17,12 @@ use std::path::Path;
 use crate::workflow_utils::{execute_agent, AgentConfig};
 use claude_agent_sdk::{AgentDefinition, ClaudeAgentOptions, SystemPrompt, SystemPromptPreset};
 
+/// Instructions appended to the claude_code preset for the documentation agent
+const SYNTHESIS_SYSTEM_PROMPT_APPEND: &str = "You are a technical writer creating comprehensive documentation from research findings. You can intelligently decide when to condense large files versus read smaller files directly.";
+
+/// Prompt for the file-condenser subagent
+const FILE_CONDENSER_PROMPT: &str = "You are a technical documentation condenser. Read the provided research result YAML file and create a condensed summary that:\n\n1. Preserves all key technical details and insights\n2. Includes important code examples (condensed if very long)\n3. Maintains actionable recommendations\n4. Reduces verbosity and redundancy\n5. Target output: 5,000-10,000 characters\n\nReturn ONLY the condensed markdown content. Do not write to any files.";
+
 /// Phase 5: Synthesize documentation from research results
 pub async fn synthesize_documentation(
     results_file: &Path,
@@ -76,10 +82,7 @@ The overview file contains a list of research findings with:
     let preset = SystemPromptPreset {
         prompt_type: "preset".to_string(),
         preset: "claude_code".to_string(),
-        append: Some(
-            "You are a technical writer creating comprehensive documentation from research findings. You can intelligently decide when to condense large files versus read smaller files directly."
-                .to_string(),
-        ),
+        append: Some(SYNTHESIS_SYSTEM_PROMPT_APPEND.to_string()),
     };
 
     // Build options with file-condenser subagent
@@ -95,7 +98,7 @@ The overview file contains a list of research findings with:
             "file-condenser",
             AgentDefinition {
                 description: "Condenses a single research result file while preserving key technical details, code examples, and actionable insights".to_string(),
-                prompt: "You are a technical documentation condenser. Read the provided research result YAML file and create a condensed summary that:\n\n1. Preserves all key technical details and insights\n2. Includes important code examples (condensed if very long)\n3. Maintains actionable recommendations\n4. Reduces verbosity and redundancy\n5. Target output: 5,000-10,000 characters\n\nReturn ONLY the condensed markdown content. Do not write to any files.".to_string(),
+                prompt: FILE_CONDENSER_PROMPT.to_string(),
                 tools: Some(vec!["Read".to_string()]),
                 model: Some("sonnet".to_string()),
             },
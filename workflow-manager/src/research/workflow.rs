@@ -9,10 +9,7 @@
 use anyhow::{Context, Result};
 use chrono::Local;
 use futures::stream::{FuturesUnordered, StreamExt};
-use std::{
-    path::{Path, PathBuf},
-    sync::Arc,
-};
+use std::{io::ErrorKind, path::PathBuf, sync::Arc};
 use tokio::{fs, sync::Semaphore};
 
 use workflow_manager_sdk::{
@@ -29,7 +26,7 @@ use crate::research::{
     phase5_synthesize::synthesize_documentation,
     types::{CodebaseAnalysis, PromptsData, ResearchResult},
 };
-use crate::workflow_utils::{execute_task, TaskContext};
+use crate::workflow_utils::{execute_task, parse_yaml, TaskContext};
 
 /// Configuration for the research workflow
 ///
@@ -97,14 +94,23 @@ impl Default for WorkflowConfig {
 }
 
 /// Load file content or return literal string
+///
+/// Attempts the read directly rather than probing with `exists()`/`is_file()`
+/// first, so a prompt file costs one open instead of two stats plus an open.
+/// Only a read error other than NotFound pays for a `metadata()` probe.
 async fn load_prompt_file(file_path: &str) -> Result<String> {
-    let path = Path::new(file_path);
-    if path.exists() && path.is_file() {
-        fs::read_to_string(path)
-            .await
-            .with_context(|| format!("Failed to read prompt file: {}", file_path))
-    } else {
-        Ok(file_path.to_string())
+    match fs::read_to_string(file_path).await {
+        Ok(content) => Ok(content),
+        Err(e) if e.kind() == ErrorKind::NotFound => Ok(file_path.to_string()),
+        // A regular file that cannot be read is an error. Anything else (a
+        // directory, a path through a file, a literal prompt that is not a
+        // valid file name) is used as the prompt, as before.
+        Err(e) => match fs::metadata(file_path).await {
+            Ok(metadata) if metadata.is_file() => {
+                Err(e).with_context(|| format!("Failed to read prompt file: {}", file_path))
+            }
+            _ => Ok(file_path.to_string()),
+        },
     }
 }
 
@@ -244,7 +250,7 @@ pub async fn run_research_workflow(config: WorkflowConfig) -> Result<()> {
             .await
             .with_context(|| format!("Failed to read analysis file: {}", analysis_file))?;
         codebase_analysis = Some(
-            serde_yaml::from_str(&content)
+            parse_yaml(&content)
                 .with_context(|| format!("Failed to parse analysis YAML from: {}", analysis_file))?,
         );
         analysis_file_path = Some(PathBuf::from(analysis_file));
@@ -283,8 +289,10 @@ pub async fn run_research_workflow(config: WorkflowConfig) -> Result<()> {
             anyhow::anyhow!("Phase 0-1 must run before Phase 2, or provide --analysis-file")
         })?;
 
-        let prompt_writer = load_prompt_file(config.system_prompt.as_ref().unwrap()).await?;
-        let output_style = load_prompt_file(config.append.as_ref().unwrap()).await?;
+        let (prompt_writer, output_style) = tokio::try_join!(
+            load_prompt_file(config.system_prompt.as_ref().unwrap()),
+            load_prompt_file(config.append.as_ref().unwrap()),
+        )?;
 
         let prompts = generate_prompts(
             config.objective.as_ref().unwrap(),
@@ -321,7 +329,7 @@ pub async fn run_research_workflow(config: WorkflowConfig) -> Result<()> {
             .await
             .with_context(|| format!("Failed to read prompts file: {}", prompts_file))?;
         prompts_data = Some(
-            serde_yaml::from_str(&content)
+            parse_yaml(&content)
                 .with_context(|| format!("Failed to parse prompts YAML from: {}", prompts_file))?,
         );
         println!("[Phase 2] Loaded prompts from: {}", prompts_file);
@@ -358,7 +366,7 @@ pub async fn run_research_workflow(config: WorkflowConfig) -> Result<()> {
         let content = fs::read_to_string(results_file)
             .await
             .with_context(|| format!("Failed to read results file: {}", results_file))?;
-        research_results = serde_yaml::from_str(&content)
+        research_results = parse_yaml(&content)
             .with_context(|| format!("Failed to parse results YAML from: {}", results_file))?;
         println!("[Phase 3] Loaded results from: {}", results_file);
         results_file_path = Some(PathBuf::from(results_file));
@@ -3,6 +3,9 @@
 use clap::Parser;
 use workflow_manager_sdk::WorkflowDefinition;
 
+/// Phase 1 batch size when --batch-size is not given
+const DEFAULT_BATCH_SIZE: usize = 5;
+
 #[derive(Parser, Debug, Clone, WorkflowDefinition)]
 #[command(
     name = "task-planner",
@@ -79,17 +82,30 @@ pub struct Args {
     )]
     pub tasks_file: Option<String>,
 
-    /// Number of tasks to process in parallel
-    /// If specified, enables simple fixed-size batching instead of AI dependency analysis
-    #[arg(long, default_value = "5")]
+    /// Number of tasks to process in parallel (default: 5)
+    /// With --simple-batching this is also the fixed batch size; with AI
+    /// dependency analysis it caps how many tasks of a batch run at once.
+    /// Phase 2 sizes review batches by token budget; when set, this also
+    /// caps the number of tasks per review batch.
+    #[arg(long)]
     #[field(
         label = "Batch Size",
-        description = "[NUMBER] Parallel execution batch size (1-10)",
+        description = "[NUMBER] Parallel execution batch size (1-10, default: 5)",
         type = "number",
         min = "1",
         max = "10"
     )]
-    pub batch_size: usize,
+    pub batch_size: Option<usize>,
+
+    /// Estimated tokens of task specifications to pack into each review batch
+    /// Defaults to half of the review context left after the shared prompt
+    #[arg(long)]
+    #[field(
+        label = "Review Tokens per Batch",
+        description = "[NUMBER] Target spec tokens per review batch (default: derived from context size)",
+        type = "number"
+    )]
+    pub target_tokens_per_batch: Option<usize>,
 
     /// Use simple fixed-size batching instead of AI dependency analysis
     #[arg(long)]
@@ -109,6 +125,16 @@ pub struct Args {
     )]
     pub output_dir: String,
 
+    /// Reuse agent responses cached in <output_dir>/.cache instead of re-running
+    /// agents whose inputs are unchanged
+    #[arg(long)]
+    #[field(
+        label = "Cache",
+        description = "[TOGGLE] Reuse cached agent responses for unchanged inputs",
+        type = "boolean"
+    )]
+    pub cache: bool,
+
     /// Directory path to analyze (codebase directory for agents to explore)
     /// Defaults to current directory
     #[arg(long)]
@@ -125,6 +151,11 @@ pub struct Args {
 }
 
 impl Args {
+    /// Batch size for Phase 1, falling back to the default when not given
+    pub fn expand_batch_size(&self) -> usize {
+        self.batch_size.unwrap_or(DEFAULT_BATCH_SIZE)
+    }
+
     /// Parse which phases to run
     pub fn get_phases(&self) -> Vec<usize> {
         self.phases
@@ -12,7 +12,8 @@
 //!
 //! **Phase 1: Expand Tasks**
 //! - Execution planning (AI dependency analysis or simple batching)
-//! - Parallel batch execution with suborchestrators
+//! - Parallel execution with suborchestrators, each task starting once its
+//!   planned dependencies are expanded
 //! - Each suborchestrator coordinates 4 specialized sub-agents:
 //!   - @files: Identifies files to create/modify
 //!   - @functions: Specifies code items (functions, structs, traits)
@@ -10,13 +10,8 @@ use crate::workflow_utils::{execute_agent, extract_yaml, AgentConfig};
 use anyhow::Result;
 use claude_agent_sdk::ClaudeAgentOptions;
 
-/// Generate tasks_overview.yaml from IMPL.md and template
-pub async fn generate_overview(impl_md: &str, overview_template: &str) -> Result<String> {
-    println!("{}", "=".repeat(80));
-    println!("PHASE 0: Main Orchestrator - Generate Task Overview");
-    println!("{}", "=".repeat(80));
-
-    let system_prompt = r#"You are a task planning specialist focused on generating high-level task overviews.
+/// System prompt for the overview generator
+const OVERVIEW_SYSTEM_PROMPT: &str = r#"You are a task planning specialist focused on generating high-level task overviews.
 
 Your goal is to analyze the implementation document and generate a tasks_overview.yaml file that breaks down the implementation into logical tasks.
 
@@ -31,6 +26,12 @@ Key instructions:
 
 Output only valid YAML, no markdown code blocks or extra commentary."#;
 
+/// Generate tasks_overview.yaml from IMPL.md and template
+pub async fn generate_overview(impl_md: &str, overview_template: &str) -> Result<String> {
+    println!("{}", "=".repeat(80));
+    println!("PHASE 0: Main Orchestrator - Generate Task Overview");
+    println!("{}", "=".repeat(80));
+
     let prompt = format!(
         r#"Using the implementation document below, generate tasks_overview.yaml following the template structure.
 
@@ -51,7 +52,7 @@ Make sure to just give your response. You must not create or write any files jus
     );
 
     let options = ClaudeAgentOptions::builder()
-        .system_prompt(system_prompt.to_string())
+        .system_prompt(OVERVIEW_SYSTEM_PROMPT.to_string())
         .allowed_tools(vec![
             "Read".to_string(),
             "Grep".to_string(),
@@ -2,7 +2,8 @@
 //!
 //! This phase:
 //! - Generates execution plan (AI dependency analysis or simple batching)
-//! - Executes suborchestrators in parallel batches
+//! - Executes suborchestrators in parallel, starting each task as soon as the
+//!   dependencies the plan placed in earlier batches are expanded
 //! - Each suborchestrator coordinates 4 specialized sub-agents:
 //!   - @files: Identifies files to create/modify
 //!   - @functions: Specifies code items (functions, structs, traits)
@@ -12,42 +13,22 @@
 
 use crate::task_planner::utils::{
     build_execution_batches_fallback, generate_ai_execution_plan, generate_simple_execution_plan,
-    get_task_id, get_task_name, parse_execution_plan,
+    get_task_dependencies, get_task_id, get_task_name, parse_execution_plan, parse_task_documents,
+};
+use crate::workflow_utils::{
+    discard_cached_response, execute_agent, execute_dag, execute_task, extract_yaml,
+    store_cached_response, AgentConfig,
 };
-use crate::workflow_utils::{execute_agent, execute_batch, execute_task, extract_yaml, parse_yaml_multi, AgentConfig};
 use anyhow::{Context, Result};
 use claude_agent_sdk::{AgentDefinition, ClaudeAgentOptions};
 use serde_yaml::Value;
+use std::collections::HashMap;
 use std::path::{Path, PathBuf};
 use tokio::fs;
 use workflow_manager_sdk::log_state_file;
 
-/// Sanitize task name for use in filename
-fn sanitize_filename(name: &str) -> String {
-    name.chars()
-        .map(|c| if c.is_alphanumeric() || c == '-' { c } else { '_' })
-        .collect::<String>()
-        .trim_matches('_')
-        .to_string()
-}
-
-/// Execute a single suborchestrator to expand a task
-async fn expand_single_task(
-    task: &Value,
-    task_template: &str,
-) -> Result<String> {
-    let task_id = get_task_id(task)
-        .ok_or_else(|| anyhow::anyhow!("Task missing id field"))?;
-    let task_name = get_task_name(task)
-        .ok_or_else(|| anyhow::anyhow!("Task missing name field"))?;
-
-    // Serialize task overview to YAML
-    let task_overview_yaml = serde_yaml::to_string(task)?;
-
-    // Define specialized sub-agents
-    let files_agent = AgentDefinition {
-        description: "Specialist that identifies all files to be created or modified".to_string(),
-        prompt: r#"You are a files identification specialist.
+/// Prompt for the @files sub-agent
+const FILES_AGENT_PROMPT: &str = r#"You are a files identification specialist.
 
 Identify all files that will be created or modified for the task.
 For each file, provide:
@@ -65,18 +46,10 @@ files:
       Multi-line description
       with more details.
 
-Output valid YAML only, no markdown."#.to_string(),
-        tools: Some(vec![
-            "Read".to_string(),
-            "Grep".to_string(),
-            "Glob".to_string(),
-        ]),
-        model: Some("sonnet".to_string()),
-    };
+Output valid YAML only, no markdown."#;
 
-    let functions_agent = AgentDefinition {
-        description: "Specialist that specifies functions, structs, traits, and other code items".to_string(),
-        prompt: r#"You are a functions specification specialist.
+/// Prompt for the @functions sub-agent
+const FUNCTIONS_AGENT_PROMPT: &str = r#"You are a functions specification specialist.
 
 Identify all functions, structs, enums, traits, and other items to be implemented.
 For each item, provide:
@@ -106,18 +79,10 @@ functions:
         postconditions: |
           - Outcome 1
 
-Output valid YAML only, no markdown."#.to_string(),
-        tools: Some(vec![
-            "Read".to_string(),
-            "Grep".to_string(),
-            "Glob".to_string(),
-        ]),
-        model: Some("sonnet".to_string()),
-    };
+Output valid YAML only, no markdown."#;
 
-    let formal_agent = AgentDefinition {
-        description: "Specialist that determines formal verification requirements".to_string(),
-        prompt: r#"You are a formal verification specialist.
+/// Prompt for the @formal sub-agent
+const FORMAL_AGENT_PROMPT: &str = r#"You are a formal verification specialist.
 
 Determine if formal verification is needed for the task.
 Provide:
@@ -134,14 +99,10 @@ formal_verification:
   explanation: |
     Explanation here
 
-Output valid YAML only, no markdown."#.to_string(),
-        tools: Some(vec!["Read".to_string()]),
-        model: Some("sonnet".to_string()),
-    };
+Output valid YAML only, no markdown."#;
 
-    let tests_agent = AgentDefinition {
-        description: "Specialist that designs test strategy and implements test code".to_string(),
-        prompt: r#"You are a testing specialist.
+/// Prompt for the @tests sub-agent
+const TESTS_AGENT_PROMPT: &str = r#"You are a testing specialist.
 
 Design comprehensive tests for the task.
 Provide:
@@ -168,33 +129,11 @@ tests:
   coverage:
     - "Behavior 1"
 
-Output valid YAML only, no markdown."#.to_string(),
-        tools: Some(vec!["Read".to_string(), "Grep".to_string()]),
-        model: Some("sonnet".to_string()),
-    };
-
-    // System prompt for suborchestrator
-    let system_prompt = format!(
-        r#"Your task is to expand Task {} ("{}") from a high-level overview into a complete, detailed specification.
-
-## OBJECTIVE
-Transform the task overview below into a complete task specification that matches the task_template structure by delegating to specialized agents.
-
-IMPORTANT: You are in the PLANNING phase. DO NOT create, write, or modify any files. Your sole purpose is to OUTPUT a YAML specification that describes what should be implemented.
+Output valid YAML only, no markdown."#;
 
-## INPUT: TASK OVERVIEW (High-level)
-This is the current state of Task {} - a strategic description of WHAT needs to be done and WHY:
-```yaml
-{}
-```
-
-## OUTPUT TARGET: TASK TEMPLATE (Detailed structure)
-Your goal is to produce a complete YAML document following this template structure:
-```yaml
-{}
-```
-
-## YOUR SPECIALIZED AGENTS
+/// Task-independent part of the suborchestrator system prompt: agent roster,
+/// workflow and output rules
+const SUBORCHESTRATOR_INSTRUCTIONS: &str = r#"## YOUR SPECIALIZED AGENTS
 You have 4 sub-agents available to help you fill out different sections of the task_template:
 
 1. **@files agent** → Fills the `files:` section
@@ -228,14 +167,99 @@ When combining sub-agent outputs into the final YAML, you MUST follow these rule
 3. **Preserve exact literal block format from sub-agent responses**
 
 ## IMPORTANT REQUIREMENTS
-- Preserve task id ({}) and name ("{}") from the overview
+- Preserve the task id and name from the overview
 - Expand the context section based on the overview's description
 - Include the dependencies section from the overview
 - All sections must be complete and valid YAML
 - Output ONLY the final YAML, no markdown code blocks or commentary
 - DO NOT create, write, or modify any files - this is a planning phase only
-- Your job is to OUTPUT the specification, not to implement it"#,
-        task_id, task_name, task_id, task_overview_yaml, task_template, task_id, task_name
+- Your job is to OUTPUT the specification, not to implement it"#;
+
+/// Sanitize task name for use in filename
+fn sanitize_filename(name: &str) -> String {
+    name.chars()
+        .map(|c| if c.is_alphanumeric() || c == '-' { c } else { '_' })
+        .collect::<String>()
+        .trim_matches('_')
+        .to_string()
+}
+
+/// Execute a single suborchestrator to expand a task
+async fn expand_single_task(
+    task: &Value,
+    task_template: &str,
+    cache_dir: Option<&Path>,
+) -> Result<String> {
+    let task_id = get_task_id(task)
+        .ok_or_else(|| anyhow::anyhow!("Task missing id field"))?;
+    let task_name = get_task_name(task)
+        .ok_or_else(|| anyhow::anyhow!("Task missing name field"))?;
+
+    // Serialize task overview to YAML
+    let task_overview_yaml = serde_yaml::to_string(task)?;
+
+    // Define specialized sub-agents
+    let files_agent = AgentDefinition {
+        description: "Specialist that identifies all files to be created or modified".to_string(),
+        prompt: FILES_AGENT_PROMPT.to_string(),
+        tools: Some(vec![
+            "Read".to_string(),
+            "Grep".to_string(),
+            "Glob".to_string(),
+        ]),
+        model: Some("sonnet".to_string()),
+    };
+
+    let functions_agent = AgentDefinition {
+        description: "Specialist that specifies functions, structs, traits, and other code items".to_string(),
+        prompt: FUNCTIONS_AGENT_PROMPT.to_string(),
+        tools: Some(vec![
+            "Read".to_string(),
+            "Grep".to_string(),
+            "Glob".to_string(),
+        ]),
+        model: Some("sonnet".to_string()),
+    };
+
+    let formal_agent = AgentDefinition {
+        description: "Specialist that determines formal verification requirements".to_string(),
+        prompt: FORMAL_AGENT_PROMPT.to_string(),
+        tools: Some(vec!["Read".to_string()]),
+        model: Some("sonnet".to_string()),
+    };
+
+    let tests_agent = AgentDefinition {
+        description: "Specialist that designs test strategy and implements test code".to_string(),
+        prompt: TESTS_AGENT_PROMPT.to_string(),
+        tools: Some(vec!["Read".to_string(), "Grep".to_string()]),
+        model: Some("sonnet".to_string()),
+    };
+
+    // System prompt for suborchestrator. Everything shared by all tasks comes
+    // first and the task's own overview last, so every suborchestrator in a
+    // run sends the same prompt prefix and can hit the API's prompt cache.
+    let system_prompt = format!(
+        r#"Your task is to expand one task from a high-level overview into a complete, detailed specification.
+
+## OBJECTIVE
+Transform the task overview (given at the end of this prompt) into a complete task specification that matches the task_template structure by delegating to specialized agents.
+
+IMPORTANT: You are in the PLANNING phase. DO NOT create, write, or modify any files. Your sole purpose is to OUTPUT a YAML specification that describes what should be implemented.
+
+## OUTPUT TARGET: TASK TEMPLATE (Detailed structure)
+Your goal is to produce a complete YAML document following this template structure:
+```yaml
+{}
+```
+
+{}
+
+## INPUT: TASK OVERVIEW (High-level)
+This is the current state of Task {} ("{}") - a strategic description of WHAT needs to be done and WHY:
+```yaml
+{}
+```"#,
+        task_template, SUBORCHESTRATOR_INSTRUCTIONS, task_id, task_name, task_overview_yaml
     );
 
     let query_prompt = format!(
@@ -248,8 +272,28 @@ IMPORTANT: Run all agents in parallel for maximum efficiency:
         task_id, task_name
     );
 
+    // The sub-agent definitions shape the response as much as the system
+    // prompt does, so both go into the cache key
+    let agents_fingerprint: Vec<_> = [
+        ("files", &files_agent),
+        ("functions", &functions_agent),
+        ("formal", &formal_agent),
+        ("tests", &tests_agent),
+    ]
+    .iter()
+    .map(|(name, agent)| {
+        (
+            *name,
+            agent.description.clone(),
+            agent.prompt.clone(),
+            agent.tools.clone(),
+            agent.model.clone(),
+        )
+    })
+    .collect();
+
     let options = ClaudeAgentOptions::builder()
-        .system_prompt(system_prompt)
+        .system_prompt(system_prompt.clone())
         .allowed_tools(vec![
             "Read".to_string(),
             "Grep".to_string(),
@@ -263,18 +307,36 @@ IMPORTANT: Run all agents in parallel for maximum efficiency:
         .permission_mode(claude_agent_sdk::PermissionMode::BypassPermissions)
         .build();
 
-    let config = AgentConfig::new(
+    let mut config = AgentConfig::new(
         format!("expand_{}", task_id),  // Match parent task ID for proper TUI nesting
         format!("Task {} Suborchestrator", task_id),
         format!("Expanding task {} with sub-agents", task_id),
         query_prompt,
         options,
     );
+    if let Some(cache_dir) = cache_dir {
+        config = config.with_cache(cache_dir, (&system_prompt, &agents_fingerprint));
+    }
+    let cache_file = config.cache_file.clone();
 
     let response = execute_agent(config).await?;
 
     // Extract YAML from response
     let yaml_content = extract_yaml(&response);
+
+    // Only keep a cached response that yields a task specification
+    if let Some(cache_file) = &cache_file {
+        // Checked with serde_yaml directly: parse_yaml reports failures on
+        // stderr, and a rejected cache entry is not a user-facing error
+        let is_task = serde_yaml::from_str::<Value>(&yaml_content)
+            .map_or(false, |doc| get_task_id(&doc).is_some());
+        if is_task {
+            store_cached_response(cache_file, &response).await;
+        } else {
+            discard_cached_response(cache_file).await;
+        }
+    }
+
     Ok(yaml_content)
 }
 
@@ -286,13 +348,14 @@ pub async fn expand_tasks(
     batch_size: usize,
     output_dir: &Path,
     timestamp: &str,
+    cache_dir: Option<&Path>,
 ) -> Result<Vec<PathBuf>> {
     println!("\n{}", "=".repeat(80));
     println!("PHASE 1: Suborchestrators - Expand Tasks");
     println!("{}", "=".repeat(80));
 
     // Parse tasks overview
-    let tasks: Vec<Value> = parse_yaml_multi(tasks_overview_yaml)
+    let tasks: Vec<Value> = parse_task_documents(tasks_overview_yaml)
         .context("Failed to parse tasks_overview.yaml")?;
 
     println!("Found {} tasks to expand\n", tasks.len());
@@ -323,72 +386,102 @@ pub async fn expand_tasks(
     }
     println!();
 
-    // Execute batches and save files immediately
-    let mut saved_files = Vec::new();
-
+    // Flatten the plan and keep only dependencies on tasks from earlier
+    // batches. Each task then starts as soon as those are expanded instead of
+    // waiting for the slowest task of the previous batch; the edges always
+    // point backwards in plan order, so the graph has no cycles.
+    let mut batch_of: HashMap<u32, usize> = HashMap::new();
     for (batch_num, batch) in batches.iter().enumerate() {
-        println!("\n→ Executing Batch {}/{}", batch_num + 1, batches.len());
-        println!("  Running {} task(s)...\n", batch.len());
-
-        // Execute batch in parallel using execute_batch
-        let task_template_clone = task_template.to_string();
-        let output_dir_clone = output_dir.to_path_buf();
-
-        let expanded_batch = execute_batch(
-            1, // phase number
-            batch.clone(),
-            batch.len(), // concurrency = batch size (all parallel)
-            move |task, ctx| {
-                let task_template = task_template_clone.clone();
-                let output_dir = output_dir_clone.clone();
-
-                async move {
-                    let task_id = get_task_id(&task).unwrap_or(0);
-                    let task_name = get_task_name(&task).unwrap_or("Unknown").to_string();
-                    let task_clone = task.clone();
-
-                    let file_path = execute_task(
-                        format!("expand_{}", task_id),
-                        format!("Expanding: {}", task_name),
-                        ctx,
-                        || async move {
-                            // Expand the task
-                            let yaml = expand_single_task(&task_clone, &task_template).await?;
-
-                            // Save immediately to individual file
-                            let sanitized_name = sanitize_filename(&task_name);
-                            let filename = format!("task_{}_{}.yaml", task_id, sanitized_name);
-                            let file_path = output_dir.join(&filename);
-
-                            fs::write(&file_path, &yaml)
-                                .await
-                                .with_context(|| format!("Failed to write task file: {}", file_path.display()))?;
-
-                            // Log the saved file
-                            log_state_file!(
-                                1,
-                                file_path.display().to_string(),
-                                format!("Task {} specification", task_id)
-                            );
-
-                            println!("  ✓ Saved: {}", file_path.display());
-
-                            Ok((file_path.clone(), format!("Saved to {}", file_path.display())))
-                        }
-                    ).await?;
-
-                    // Return tuple for execute_batch
-                    Ok((file_path, format!("Task {} saved", task_id)))
-                }
-            },
-        )
-        .await?;
+        for task_id in batch.iter().filter_map(get_task_id) {
+            batch_of.insert(task_id, batch_num);
+        }
+    }
 
-        // Collect saved file paths
-        let batch_files: Vec<PathBuf> = expanded_batch.into_iter().map(|(path, _)| path).collect();
-        saved_files.extend(batch_files);
+    let mut plan_tasks = Vec::new();
+    let mut plan_index: HashMap<u32, usize> = HashMap::new();
+    let mut dependencies = Vec::new();
+    for (batch_num, batch) in batches.into_iter().enumerate() {
+        for task in batch {
+            let deps: Vec<usize> = get_task_dependencies(&task)
+                .into_iter()
+                .filter(|dep| batch_of.get(dep).is_some_and(|&b| b < batch_num))
+                .filter_map(|dep| plan_index.get(&dep).copied())
+                .collect();
+
+            if let Some(task_id) = get_task_id(&task) {
+                plan_index.insert(task_id, plan_tasks.len());
+            }
+            dependencies.push(deps);
+            plan_tasks.push(task);
+        }
     }
 
+    println!(
+        "\n→ Expanding {} task(s), up to {} at a time as dependencies complete\n",
+        plan_tasks.len(),
+        batch_size.max(1)
+    );
+
+    // Execute tasks and save files immediately
+    let task_template_clone = task_template.to_string();
+    let output_dir_clone = output_dir.to_path_buf();
+    let cache_dir_clone = cache_dir.map(Path::to_path_buf);
+
+    let expanded = execute_dag(
+        1, // phase number
+        plan_tasks,
+        dependencies,
+        batch_size,
+        move |task, ctx| {
+            let task_template = task_template_clone.clone();
+            let output_dir = output_dir_clone.clone();
+            let cache_dir = cache_dir_clone.clone();
+
+            async move {
+                let task_id = get_task_id(&task).unwrap_or(0);
+                let task_name = get_task_name(&task).unwrap_or("Unknown").to_string();
+                let task_clone = task.clone();
+
+                let file_path = execute_task(
+                    format!("expand_{}", task_id),
+                    format!("Expanding: {}", task_name),
+                    ctx,
+                    || async move {
+                        // Expand the task
+                        let yaml = expand_single_task(&task_clone, &task_template, cache_dir.as_deref()).await?;
+
+                        // Save immediately to individual file
+                        let sanitized_name = sanitize_filename(&task_name);
+                        let filename = format!("task_{}_{}.yaml", task_id, sanitized_name);
+                        let file_path = output_dir.join(&filename);
+
+                        fs::write(&file_path, &yaml)
+                            .await
+                            .with_context(|| format!("Failed to write task file: {}", file_path.display()))?;
+
+                        // Log the saved file
+                        log_state_file!(
+                            1,
+                            file_path.display().to_string(),
+                            format!("Task {} specification", task_id)
+                        );
+
+                        println!("  ✓ Saved: {}", file_path.display());
+
+                        Ok((file_path.clone(), format!("Saved to {}", file_path.display())))
+                    }
+                ).await?;
+
+                // Return tuple for execute_dag
+                Ok((file_path, format!("Task {} saved", task_id)))
+            }
+        },
+    )
+    .await?;
+
+    // Collect saved file paths
+    let saved_files: Vec<PathBuf> = expanded.into_iter().map(|(path, _)| path).collect();
+
     println!("\n{}", "=".repeat(80));
     println!("✓ All {} tasks expanded and saved", saved_files.len());
     println!("{}", "=".repeat(80));
@@ -7,15 +7,27 @@
 //! - Validates: completeness, consistency, correctness, testability
 //! - Generates final review report
 
-use crate::task_planner::utils::{get_task_id, get_task_name};
-use crate::workflow_utils::{execute_agent, execute_batch, execute_task, parse_yaml_multi, AgentConfig};
+use crate::task_planner::utils::{get_task_id, get_task_name, parse_task_documents};
+use crate::workflow_utils::{
+    discard_cached_response, execute_agent, execute_batch, execute_task, iter_yaml_documents,
+    store_cached_response, AgentConfig,
+};
 use anyhow::{Context, Result};
 use claude_agent_sdk::{AgentDefinition, ClaudeAgentOptions};
 use serde_yaml::Value;
 use std::collections::HashMap;
+use std::fmt::Write;
 use std::path::Path;
 use tokio::fs;
 
+/// Most review suborchestrators in flight at once. Each one fans out to a
+/// @reviewer per task in its batch, so this keeps large plans from opening
+/// dozens of concurrent sessions and running into API rate limits.
+const MAX_CONCURRENT_REVIEWS: usize = 4;
+
+/// Context window, in tokens, that a review batch's prompt is sized against
+const REVIEW_CONTEXT_TOKENS: usize = 150_000;
+
 /// Review result structure (parsed from JSON)
 struct ReviewResult {
     task_id: u32,
@@ -24,16 +36,46 @@ struct ReviewResult {
     summary: String,
 }
 
-/// Execute review suborchestrator for a batch of tasks
-async fn review_batch(
-    batch: Vec<(Value, Value)>, // (overview, detailed) pairs
-    impl_md: &str,
-    task_template: &str,
-) -> Result<Vec<ReviewResult>> {
-    // Define the reviewer agent
-    let reviewer_agent = AgentDefinition {
-        description: "Specialist that validates individual task specifications against requirements".to_string(),
-        prompt: r#"You are an implementation plan reviewer.
+/// A matched task awaiting review, with both documents serialized once for
+/// batch sizing and the review prompt
+struct ReviewTask {
+    task_id: u32,
+    task_name: String,
+    overview_yaml: String,
+    detailed_yaml: String,
+}
+
+impl ReviewTask {
+    fn new(overview: &Value, detailed: &Value) -> Result<Self> {
+        let task_id = get_task_id(overview).unwrap_or(0);
+        Ok(Self {
+            task_id,
+            task_name: get_task_name(overview).unwrap_or("Unknown").to_string(),
+            overview_yaml: serde_yaml::to_string(overview)
+                .with_context(|| format!("Failed to serialize overview of task {}", task_id))?,
+            detailed_yaml: serde_yaml::to_string(detailed).with_context(|| {
+                format!("Failed to serialize specification of task {}", task_id)
+            })?,
+        })
+    }
+
+    /// Estimated prompt tokens taken by this task's detailed specification
+    ///
+    /// The overview is left out: the whole of tasks_overview.yaml is
+    /// reserved up front when the budget is computed.
+    fn tokens(&self) -> usize {
+        estimate_tokens(&self.detailed_yaml)
+    }
+}
+
+/// Model that reviews every task first
+const FIRST_PASS_MODEL: &str = "haiku";
+
+/// Model that re-reviews the tasks the first pass flags or fails to assess
+const ESCALATION_MODEL: &str = "sonnet";
+
+/// Prompt for the @reviewer agent, on either model
+const REVIEWER_PROMPT: &str = r#"You are an implementation plan reviewer.
 
 Your job is to validate that a detailed task specification (from tasks.yaml) matches its overview (from tasks_overview.yaml) and aligns with the IMPL.md requirements.
 
@@ -55,27 +97,13 @@ Report any issues found. If everything looks good, confirm that.
 Format your response as:
 ASSESSMENT: [APPROVED|NEEDS_REVISION]
 ISSUES: [List any issues, or "None"]
-SUMMARY: [Brief summary]"#.to_string(),
-        tools: Some(vec!["Read".to_string()]),
-        model: Some("sonnet".to_string()),
-    };
+SUMMARY: [Brief summary]"#;
 
-    // Build task list for suborchestrator
-    let task_list: Vec<String> = batch
-        .iter()
-        .map(|(overview, _)| {
-            let task_id = get_task_id(overview).unwrap_or(0);
-            let task_name = get_task_name(overview).unwrap_or("Unknown");
-            format!("  - Task {}: {}", task_id, task_name)
-        })
-        .collect();
-
-    // System prompt for suborchestrator
-    let system_prompt = format!(
-        r#"You are a review suborchestrator coordinating Phase 2: Review & Validation.
+/// System prompt for the review suborchestrator, identical for every batch
+const REVIEW_SYSTEM_PROMPT: &str = r#"You are a review suborchestrator coordinating Phase 2: Review & Validation.
 
 ## YOUR ROLE
-Coordinate the @reviewer agent to validate all {} tasks in your batch.
+Coordinate @reviewer agents to validate all tasks in your batch.
 
 ## AVAILABLE CONTEXT
 - Implementation requirements (IMPL.md)
@@ -97,23 +125,168 @@ Coordinate the @reviewer agent to validate all {} tasks in your batch.
 ## OUTPUT FORMAT
 Output ONLY a valid JSON array with this exact structure:
 [
-  {{
+  {
     "task_id": <task_id_number>,
     "success": <true|false>,
     "issues": [<list of issue strings, or empty array>],
     "summary": "<brief summary string>"
-  }},
+  },
   ...
 ]
 
 IMPORTANT:
 - Convert ASSESSMENT to success boolean (APPROVED=true, NEEDS_REVISION=false)
-- Output ONLY the JSON array, no markdown code blocks, no extra commentary"#,
-        batch.len()
-    );
+- Output ONLY the JSON array, no markdown code blocks, no extra commentary"#;
+
+/// Rough token count of a text, at about four bytes per token
+fn estimate_tokens(text: &str) -> usize {
+    text.len() / 4
+}
+
+/// Split matched tasks into review batches
+///
+/// Tasks are packed greedily until adding the next task's specification
+/// would take the batch past `token_budget` estimated tokens, so small specs
+/// share a batch and a few very large ones cannot crowd one prompt. A task
+/// that is over budget on its own still gets a batch of its own. With
+/// `max_tasks`, a batch is also closed once it holds that many tasks.
+fn pack_review_batches(
+    tasks: Vec<ReviewTask>,
+    max_tasks: Option<usize>,
+    token_budget: usize,
+) -> Vec<Vec<ReviewTask>> {
+    let mut batches = Vec::new();
+    let mut batch = Vec::new();
+    let mut batch_tokens = 0;
+
+    for task in tasks {
+        let tokens = task.tokens();
+
+        let full = batch_tokens + tokens > token_budget
+            || max_tasks.map_or(false, |max_tasks| batch.len() >= max_tasks);
+        if !batch.is_empty() && full {
+            batches.push(std::mem::take(&mut batch));
+            batch_tokens = 0;
+        }
+        batch_tokens += tokens;
+        batch.push(task);
+    }
+    if !batch.is_empty() {
+        batches.push(batch);
+    }
 
+    batches
+}
+
+/// Extract the JSON payload of a response, unwrapping a ```json (or plain
+/// ```) fence if there is one
+///
+/// Each fence is located with a single search, without splitting the
+/// response into intermediate pieces.
+fn extract_json(response: &str) -> &str {
+    let start = response
+        .find("```json")
+        .map(|pos| pos + 7)
+        .or_else(|| response.find("```").map(|pos| pos + 3));
+
+    match start {
+        Some(start) => {
+            let body = &response[start..];
+            body.find("```").map_or(body, |end| &body[..end]).trim()
+        }
+        None => response.trim(),
+    }
+}
+
+/// Review a batch of tasks, escalating where the first pass is unsure
+///
+/// Every task is reviewed on [`FIRST_PASS_MODEL`]. Its approvals stand;
+/// tasks it marks as needing revision, or leaves without a complete verdict,
+/// are reviewed again on [`ESCALATION_MODEL`], whose verdict is used instead.
+async fn review_batch(
+    batch: Vec<ReviewTask>,
+    impl_md: &str,
+    task_template: &str,
+    cache_dir: Option<&Path>,
+) -> Result<Vec<ReviewResult>> {
+    // A first pass that fails or cannot be parsed escalates the whole batch
+    let first_pass =
+        match run_review_pass(&batch, FIRST_PASS_MODEL, impl_md, task_template, cache_dir).await {
+            Ok(results) => results,
+            Err(e) => {
+                println!("  Warning: First review pass failed: {:#}", e);
+                Vec::new()
+            }
+        };
+    let mut first_pass: HashMap<u32, ReviewResult> = first_pass
+        .into_iter()
+        .map(|result| (result.task_id, result))
+        .collect();
+
+    let mut results = Vec::with_capacity(batch.len());
+    let mut escalated = Vec::new();
+    for task in batch {
+        match first_pass.remove(&task.task_id) {
+            Some(result) if result.success => results.push(result),
+            _ => escalated.push(task),
+        }
+    }
+
+    if !escalated.is_empty() {
+        let escalated_ids: Vec<u32> = escalated.iter().map(|task| task.task_id).collect();
+        println!(
+            "  ↑ Escalating {} of {} task(s) to {}: {:?}",
+            escalated.len(),
+            results.len() + escalated.len(),
+            ESCALATION_MODEL,
+            escalated_ids
+        );
+        let second_pass = run_review_pass(
+            &escalated,
+            ESCALATION_MODEL,
+            impl_md,
+            task_template,
+            cache_dir,
+        )
+        .await?;
+        results.extend(second_pass);
+    }
+
+    Ok(results)
+}
+
+/// Execute one review suborchestrator over `tasks`, with its @reviewer
+/// agents running on `model`
+async fn run_review_pass(
+    tasks: &[ReviewTask],
+    model: &str,
+    impl_md: &str,
+    task_template: &str,
+    cache_dir: Option<&Path>,
+) -> Result<Vec<ReviewResult>> {
+    let reviewer_agent = AgentDefinition {
+        description: "Specialist that validates individual task specifications against requirements".to_string(),
+        prompt: REVIEWER_PROMPT.to_string(),
+        tools: Some(vec!["Read".to_string()]),
+        model: Some(model.to_string()),
+    };
+
+    // Build task list for suborchestrator from the already serialized specs
+    let task_list: Vec<String> = tasks
+        .iter()
+        .map(|task| {
+            format!(
+                "### Task {}: {}\n\nOverview:\n```yaml\n{}```\n\nDetailed specification:\n```yaml\n{}```",
+                task.task_id, task.task_name, task.overview_yaml, task.detailed_yaml
+            )
+        })
+        .collect();
+
+    // The query prompt puts the shared IMPL.md and template ahead of the
+    // batch's task list, so together with the fixed system prompt all batches
+    // share one prompt prefix for the API's prompt cache
     let query_prompt = format!(
-        r#"Coordinate review of all {} tasks in your batch.
+        r#"Coordinate review of all tasks in your batch.
 
 ## CONTEXT
 
@@ -128,7 +301,7 @@ IMPORTANT:
 ```
 
 ## YOUR BATCH
-Review these tasks:
+Review these {} tasks:
 {}
 
 ## INSTRUCTIONS
@@ -138,47 +311,61 @@ For EACH task above:
 3. Parse the reviewer's response
 
 Run ALL @reviewer agents in PARALLEL, then combine results into JSON array."#,
-        batch.len(),
         impl_md,
         task_template,
-        task_list.join("\n")
+        tasks.len(),
+        task_list.join("\n\n")
+    );
+
+    // The reviewer definition, including its model, shapes the response as
+    // much as the system prompt does, so both go into the cache key
+    let agent_fingerprint = (
+        reviewer_agent.description.clone(),
+        reviewer_agent.prompt.clone(),
+        reviewer_agent.tools.clone(),
+        reviewer_agent.model.clone(),
     );
 
     let options = ClaudeAgentOptions::builder()
-        .system_prompt(system_prompt)
+        .system_prompt(REVIEW_SYSTEM_PROMPT.to_string())
         .allowed_tools(vec!["Read".to_string()])
         .add_agent("reviewer", reviewer_agent)
         .permission_mode(claude_agent_sdk::PermissionMode::BypassPermissions)
         .build();
 
-    let config = AgentConfig::new(
+    let mut config = AgentConfig::new(
         "review_batch",
         "Review Suborchestrator",
-        format!("Reviewing {} tasks", batch.len()),
+        format!("Reviewing {} tasks on {}", tasks.len(), model),
         query_prompt,
         options,
     );
+    if let Some(cache_dir) = cache_dir {
+        config = config.with_cache(cache_dir, (REVIEW_SYSTEM_PROMPT, &agent_fingerprint));
+    }
+    let cache_file = config.cache_file.clone();
 
     let response = execute_agent(config).await?;
+    let results = parse_review_results(&response);
 
-    // Parse JSON response
-    let json_str = if response.contains("```json") {
-        response
-            .split("```json")
-            .nth(1)
-            .and_then(|s| s.split("```").next())
-            .unwrap_or(&response)
-            .trim()
-    } else if response.contains("```") {
-        response
-            .split("```")
-            .nth(1)
-            .and_then(|s| s.split("```").next())
-            .unwrap_or(&response)
-            .trim()
-    } else {
-        response.trim()
-    };
+    // Only keep a cached response that parsed
+    if let Some(cache_file) = &cache_file {
+        if results.is_ok() {
+            store_cached_response(cache_file, &response).await;
+        } else {
+            discard_cached_response(cache_file).await;
+        }
+    }
+
+    results
+}
+
+/// Parse the suborchestrator's JSON array of review results
+///
+/// Entries without a task ID or a success flag are skipped, which leaves
+/// their tasks without a verdict.
+fn parse_review_results(response: &str) -> Result<Vec<ReviewResult>> {
+    let json_str = extract_json(response);
 
     let json_value: serde_json::Value = serde_json::from_str(json_str)
         .context("Failed to parse review results JSON")?;
@@ -189,13 +376,11 @@ Run ALL @reviewer agents in PARALLEL, then combine results into JSON array."#,
 
     let mut results = Vec::new();
     for result in results_array {
-        let task_id = result["task_id"]
-            .as_u64()
-            .ok_or_else(|| anyhow::anyhow!("Missing task_id"))?
-            as u32;
-        let success = result["success"]
-            .as_bool()
-            .ok_or_else(|| anyhow::anyhow!("Missing success"))?;
+        let (Some(task_id), Some(success)) =
+            (result["task_id"].as_u64(), result["success"].as_bool())
+        else {
+            continue;
+        };
         let issues: Vec<String> = result["issues"]
             .as_array()
             .map(|arr| {
@@ -210,7 +395,7 @@ Run ALL @reviewer agents in PARALLEL, then combine results into JSON array."#,
             .to_string();
 
         results.push(ReviewResult {
-            task_id,
+            task_id: task_id as u32,
             success,
             issues,
             summary,
@@ -226,73 +411,100 @@ pub async fn review_tasks(
     tasks_yaml: &str,
     impl_md: &str,
     task_template: &str,
-    batch_size: usize,
+    batch_size: Option<usize>,
+    target_tokens_per_batch: Option<usize>,
+    cache_dir: Option<&Path>,
 ) -> Result<()> {
     println!("\n{}", "=".repeat(80));
     println!("PHASE 2: Batched Review - Validate Tasks");
     println!("{}", "=".repeat(80));
 
-    // Parse both overview and detailed tasks
-    let overview_tasks: Vec<Value> = parse_yaml_multi(tasks_overview_yaml)
+    // Parse overview tasks; detailed tasks are streamed straight into the
+    // lookup map so the parsed documents are never held twice
+    let overview_tasks: Vec<Value> = parse_task_documents(tasks_overview_yaml)
         .context("Failed to parse tasks_overview.yaml")?;
-    let detailed_tasks: Vec<Value> =
-        parse_yaml_multi(tasks_yaml).context("Failed to parse tasks.yaml")?;
-
-    println!(
-        "Matching {} overview tasks with {} detailed tasks\n",
-        overview_tasks.len(),
-        detailed_tasks.len()
-    );
 
-    // Build lookup map for detailed tasks
+    let mut detailed_count = 0;
     let mut detailed_map: HashMap<u32, Value> = HashMap::new();
-    for task in detailed_tasks {
+    for task in iter_yaml_documents::<Value>(tasks_yaml) {
+        let task = task.context("Failed to parse tasks.yaml")?;
+        detailed_count += 1;
         if let Some(task_id) = get_task_id(&task) {
             detailed_map.insert(task_id, task);
         }
     }
 
-    // Match overview with detailed
-    let mut task_pairs = Vec::new();
+    println!(
+        "Matching {} overview tasks with {} detailed tasks\n",
+        overview_tasks.len(),
+        detailed_count
+    );
+
+    // Match overview with detailed in one pass over the overview, collecting
+    // the unmatched IDs for a single warning. Each matched pair is serialized
+    // here, once, for both batch sizing and the review prompt.
+    let mut review_tasks = Vec::with_capacity(overview_tasks.len());
+    let mut missing = Vec::new();
     for overview in overview_tasks {
         let task_id = get_task_id(&overview).unwrap_or(0);
-        if let Some(detailed) = detailed_map.remove(&task_id) {
-            task_pairs.push((overview, detailed));
-        } else {
-            println!(
-                "Warning: No detailed task found for overview task {}",
-                task_id
-            );
+        match detailed_map.remove(&task_id) {
+            Some(detailed) => review_tasks.push(ReviewTask::new(&overview, &detailed)?),
+            None => missing.push(task_id),
         }
     }
+    if !missing.is_empty() {
+        println!(
+            "Warning: No detailed task found for overview task(s) {:?}",
+            missing
+        );
+    }
 
-    // Create batches
-    let batches: Vec<Vec<(Value, Value)>> = task_pairs
-        .chunks(batch_size)
-        .map(|chunk| chunk.to_vec())
-        .collect();
+    // Create batches. Every batch repeats the system prompt, IMPL.md and the
+    // template, and its task overviews are a part of tasks_overview.yaml, so
+    // all of those are reserved; the detailed specs get half of what is left
+    // of the context window unless a target is given.
+    let token_budget = target_tokens_per_batch.unwrap_or_else(|| {
+        let reserved = estimate_tokens(REVIEW_SYSTEM_PROMPT)
+            + estimate_tokens(impl_md)
+            + estimate_tokens(task_template)
+            + estimate_tokens(tasks_overview_yaml);
+        REVIEW_CONTEXT_TOKENS.saturating_sub(reserved) / 2
+    });
+    let batches = pack_review_batches(review_tasks, batch_size, token_budget);
 
     println!(
-        "Created {} batch(es) with batch_size={}\n",
+        "Created {} batch(es) of up to ~{} tokens of specs{}, reviewing up to {} at a time",
         batches.len(),
-        batch_size
+        token_budget,
+        batch_size.map_or(String::new(), |max| format!(" and {} tasks", max)),
+        MAX_CONCURRENT_REVIEWS
     );
+    for (idx, batch) in batches.iter().enumerate() {
+        println!(
+            "  Batch {}: {} task(s), ~{} tokens of specs",
+            idx + 1,
+            batch.len(),
+            batch.iter().map(ReviewTask::tokens).sum::<usize>()
+        );
+    }
+    println!();
 
     // Execute review batches
     let impl_md_clone = impl_md.to_string();
     let task_template_clone = task_template.to_string();
-    let num_batches = batches.len();
+    let cache_dir_clone = cache_dir.map(Path::to_path_buf);
 
     let all_results = execute_batch(
         2, // phase number
         batches,
-        num_batches, // run all batches in parallel? or sequential? Let's do sequential for now
+        MAX_CONCURRENT_REVIEWS,
         move |batch, ctx| {
             let impl_md = impl_md_clone.clone();
             let task_template = task_template_clone.clone();
+            let cache_dir = cache_dir_clone.clone();
             async move {
                 // Get batch task IDs for logging
-                let task_ids: Vec<u32> = batch.iter().filter_map(|(overview, _)| get_task_id(overview)).collect();
+                let task_ids: Vec<u32> = batch.iter().map(|task| task.task_id).collect();
                 let batch_desc = if task_ids.len() == 1 {
                     format!("Reviewing task {}", task_ids[0])
                 } else {
@@ -304,8 +516,21 @@ pub async fn review_tasks(
                     batch_desc,
                     ctx,
                     || async move {
-                        let results = review_batch(batch, &impl_md, &task_template).await?;
-                        Ok((results, format!("Review batch complete")))
+                        let results = review_batch(batch, &impl_md, &task_template, cache_dir.as_deref()).await?;
+
+                        // Show each verdict as soon as its batch is done rather
+                        // than only in the final report
+                        for result in &results {
+                            println!(
+                                "  {} Task {}: {}",
+                                if result.success { "✓" } else { "✗" },
+                                result.task_id,
+                                result.summary
+                            );
+                        }
+                        let approved = results.iter().filter(|r| r.success).count();
+                        let summary = format!("{}/{} approved", approved, results.len());
+                        Ok((results, summary))
                     }
                 ).await?;
 
@@ -330,64 +555,139 @@ pub async fn review_tasks(
 
 /// Generate final review report
 async fn generate_review_report(results: &[ReviewResult]) -> Result<()> {
+    // A single pass over the results counts the approvals and fills both the
+    // console list of tasks requiring revision and the report file's body
+    let mut approved = 0;
+    let mut revisions = String::new();
+    let mut body = String::new();
+    for result in results {
+        if result.success {
+            approved += 1;
+        } else {
+            let _ = writeln!(revisions, "  Task {}:", result.task_id);
+            for issue in &result.issues {
+                let _ = writeln!(revisions, "    - {}", issue);
+            }
+            let _ = writeln!(revisions, "    Summary: {}\n", result.summary);
+        }
+
+        let _ = writeln!(
+            body,
+            "\nTask {}: {}",
+            result.task_id,
+            if result.success {
+                "APPROVED"
+            } else {
+                "NEEDS REVISION"
+            }
+        );
+        let _ = writeln!(body, "Summary: {}", result.summary);
+        if !result.issues.is_empty() {
+            body.push_str("Issues:\n");
+            for issue in &result.issues {
+                let _ = writeln!(body, "  - {}", issue);
+            }
+        }
+        body.push('\n');
+    }
+    let needs_revision = results.len() - approved;
+
     println!("\n{}", "=".repeat(80));
     println!("FINAL REPORT: Main Orchestrator Summary");
     println!("{}", "=".repeat(80));
 
-    let approved = results.iter().filter(|r| r.success).count();
-    let needs_revision = results.len() - approved;
-
     println!("Total tasks reviewed: {}", results.len());
     println!("✓ Approved: {}", approved);
     println!("✗ Needs revision: {}\n", needs_revision);
 
     if needs_revision > 0 {
         println!("Tasks requiring revision:\n");
-        for result in results {
-            if !result.success {
-                println!("  Task {}:", result.task_id);
-                for issue in &result.issues {
-                    println!("    - {}", issue);
-                }
-                println!("    Summary: {}\n", result.summary);
-            }
-        }
+        print!("{}", revisions);
     } else {
         println!("✓ All tasks approved! Ready for implementation.\n");
     }
 
     // Save report to file
     let report_path = Path::new("task_review_report.txt");
-    let mut report = String::new();
-    report.push_str(&"=".repeat(80));
-    report.push_str("\nTASK REVIEW REPORT\n");
-    report.push_str(&"=".repeat(80));
-    report.push_str(&format!("\n\nTotal tasks: {}\n", results.len()));
-    report.push_str(&format!("Approved: {}\n", approved));
-    report.push_str(&format!("Needs revision: {}\n\n", needs_revision));
-
-    for result in results {
-        report.push_str(&format!(
-            "\nTask {}: {}\n",
-            result.task_id,
-            if result.success {
-                "APPROVED"
-            } else {
-                "NEEDS REVISION"
-            }
-        ));
-        report.push_str(&format!("Summary: {}\n", result.summary));
-        if !result.issues.is_empty() {
-            report.push_str("Issues:\n");
-            for issue in &result.issues {
-                report.push_str(&format!("  - {}\n", issue));
-            }
-        }
-        report.push_str("\n");
-    }
+    let rule = "=".repeat(80);
+    let report = format!(
+        "{}\nTASK REVIEW REPORT\n{}\n\nTotal tasks: {}\nApproved: {}\nNeeds revision: {}\n\n{}",
+        rule,
+        rule,
+        results.len(),
+        approved,
+        needs_revision,
+        body
+    );
 
     fs::write(report_path, report).await?;
     println!("✓ Full report saved to: {}", report_path.display());
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn task(id: u32, body_len: usize) -> ReviewTask {
+        let overview: Value = serde_yaml::from_str(&format!("task: {{id: {}}}", id)).unwrap();
+        let detailed: Value = serde_yaml::from_str(&format!(
+            "task: {{id: {}, body: {}}}",
+            id,
+            "x".repeat(body_len)
+        ))
+        .unwrap();
+        ReviewTask::new(&overview, &detailed).unwrap()
+    }
+
+    fn batch_ids(batches: &[Vec<ReviewTask>]) -> Vec<Vec<u32>> {
+        batches
+            .iter()
+            .map(|batch| batch.iter().map(|task| task.task_id).collect())
+            .collect()
+    }
+
+    #[test]
+    fn test_extract_json_unwraps_fences() {
+        assert_eq!(extract_json("Done:\n```json\n[1, 2]\n```\nBye"), "[1, 2]");
+        assert_eq!(extract_json("```\n[]\n```"), "[]");
+        assert_eq!(extract_json("  [3]\n"), "[3]");
+    }
+
+    #[test]
+    fn test_parse_review_results_skips_incomplete_entries() {
+        let response = r#"[
+            {"task_id": 1, "success": true, "issues": [], "summary": "ok"},
+            {"task_id": 2, "summary": "no verdict"},
+            {"success": false}
+        ]"#;
+        let results = parse_review_results(response).unwrap();
+        assert_eq!(results.len(), 1);
+        assert_eq!(results[0].task_id, 1);
+        assert!(results[0].success);
+        assert!(parse_review_results("not json").is_err());
+    }
+
+    #[test]
+    fn test_pack_review_batches_caps_task_count() {
+        let tasks = (1..=5).map(|id| task(id, 10)).collect();
+        let batches = pack_review_batches(tasks, Some(2), usize::MAX);
+        assert_eq!(batch_ids(&batches), vec![vec![1, 2], vec![3, 4], vec![5]]);
+    }
+
+    #[test]
+    fn test_pack_review_batches_fills_budget_without_cap() {
+        let tasks = (1..=12).map(|id| task(id, 10)).collect();
+        let batches = pack_review_batches(tasks, None, usize::MAX);
+        assert_eq!(batch_ids(&batches), vec![(1..=12).collect::<Vec<u32>>()]);
+    }
+
+    #[test]
+    fn test_pack_review_batches_respects_token_budget() {
+        // Task 2 alone exceeds the budget and is isolated, not dropped
+        let tasks = vec![task(1, 100), task(2, 4000), task(3, 100), task(4, 100)];
+        let batches = pack_review_batches(tasks, None, 200);
+        assert_eq!(batch_ids(&batches), vec![vec![1], vec![2], vec![3, 4]]);
+    }
+}
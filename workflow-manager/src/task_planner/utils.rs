@@ -1,49 +1,13 @@
 //! Utility functions for task planner workflow
 
-use crate::workflow_utils::{execute_agent, AgentConfig};
+use crate::workflow_utils::{execute_agent, iter_yaml_documents, parse_yaml, AgentConfig};
 use anyhow::{Context, Result};
 use claude_agent_sdk::ClaudeAgentOptions;
 use serde_yaml::Value;
 use std::collections::HashMap;
 
-/// Extract task ID from a task YAML value
-pub fn get_task_id(task: &Value) -> Option<u32> {
-    task.get("task")?
-        .get("id")?
-        .as_u64()
-        .map(|id| id as u32)
-}
-
-/// Extract task name from a task YAML value
-pub fn get_task_name(task: &Value) -> Option<&str> {
-    task.get("task")?.get("name")?.as_str()
-}
-
-/// Generate simple execution plan (fixed-size batches)
-pub fn generate_simple_execution_plan(
-    tasks: &[Value],
-    batch_size: usize,
-) -> Result<Vec<Vec<Value>>> {
-    println!("\n{}", "=".repeat(80));
-    println!("Batch Planning: Simple batching with size={}", batch_size);
-    println!("{}", "=".repeat(80));
-
-    let mut batches = Vec::new();
-    for chunk in tasks.chunks(batch_size) {
-        batches.push(chunk.to_vec());
-    }
-
-    println!("Created {} batch(es)", batches.len());
-    Ok(batches)
-}
-
-/// Generate AI-based execution plan (dependency analysis)
-pub async fn generate_ai_execution_plan(tasks_overview_yaml: &str) -> Result<String> {
-    println!("\n{}", "=".repeat(80));
-    println!("Batch Planning: Analyzing dependencies with AI agent");
-    println!("{}", "=".repeat(80));
-
-    let system_prompt = r#"You are an execution planning specialist focused on dependency analysis and batch optimization.
+/// System prompt for the execution planner
+const EXECUTION_PLAN_SYSTEM_PROMPT: &str = r#"You are an execution planning specialist focused on dependency analysis and batch optimization.
 
 Your goal is to analyze tasks_overview.yaml and generate an optimal execution plan that maximizes parallelization while respecting dependencies.
 
@@ -58,7 +22,8 @@ Key instructions:
 
 Output only valid YAML following the template structure, no markdown code blocks or extra commentary."#;
 
-    let execution_plan_template = r#"execution_plan:
+/// YAML skeleton the execution planner fills in
+const EXECUTION_PLAN_TEMPLATE: &str = r#"execution_plan:
   total_tasks: [NUMBER]
   total_batches: [NUMBER]
 
@@ -81,6 +46,69 @@ Output only valid YAML following the template structure, no markdown code blocks
     parallelization_explanation: |
       [Explain the overall parallelization potential]"#;
 
+/// Extract task ID from a task YAML value
+pub fn get_task_id(task: &Value) -> Option<u32> {
+    task.get("task")?
+        .get("id")?
+        .as_u64()
+        .map(|id| id as u32)
+}
+
+/// Extract task name from a task YAML value
+pub fn get_task_name(task: &Value) -> Option<&str> {
+    task.get("task")?.get("name")?.as_str()
+}
+
+/// Parse the task documents of a multi-document tasks YAML
+///
+/// Documents without a top-level `task` key (headers, notes) are dropped as
+/// they are parsed, in the same pass.
+pub fn parse_task_documents(yaml: &str) -> Result<Vec<Value>> {
+    iter_yaml_documents::<Value>(yaml)
+        .filter(|doc| doc.as_ref().map_or(true, |doc| doc.get("task").is_some()))
+        .collect()
+}
+
+/// Extract the IDs listed under `dependencies.requires_completion_of`
+pub fn get_task_dependencies(task: &Value) -> Vec<u32> {
+    task.get("task")
+        .and_then(|t| t.get("dependencies"))
+        .and_then(|d| d.get("requires_completion_of"))
+        .and_then(|r| r.as_sequence())
+        .map(|deps| {
+            deps.iter()
+                .filter_map(|dep| dep.get("task_id")?.as_u64())
+                .map(|id| id as u32)
+                .collect()
+        })
+        .unwrap_or_default()
+}
+
+/// Generate simple execution plan (fixed-size batches)
+pub fn generate_simple_execution_plan(
+    tasks: &[Value],
+    batch_size: usize,
+) -> Result<Vec<Vec<Value>>> {
+    println!("\n{}", "=".repeat(80));
+    println!("Batch Planning: Simple batching with size={}", batch_size);
+    println!("{}", "=".repeat(80));
+
+    // A batch size of 0 would make `chunks` panic; treat it as 1
+    let batches: Vec<Vec<Value>> = tasks
+        .chunks(batch_size.max(1))
+        .map(<[Value]>::to_vec)
+        .collect();
+
+    println!("Created {} batch(es)", batches.len());
+    Ok(batches)
+}
+
+/// Generate AI-based execution plan (dependency analysis)
+pub async fn generate_ai_execution_plan(tasks_overview_yaml: &str) -> Result<String> {
+    println!("\n{}", "=".repeat(80));
+    println!("Batch Planning: Analyzing dependencies with AI agent");
+    println!("{}", "=".repeat(80));
+
     let prompt = format!(
         r#"Analyze the tasks and their dependencies, then generate an execution plan.
 
@@ -102,11 +130,11 @@ Generate a complete execution_plan.yaml that:
 5. Identifies critical path and parallelization potential
 
 Output only the YAML, no markdown formatting."#,
-        tasks_overview_yaml, execution_plan_template
+        tasks_overview_yaml, EXECUTION_PLAN_TEMPLATE
     );
 
     let options = ClaudeAgentOptions::builder()
-        .system_prompt(system_prompt.to_string())
+        .system_prompt(EXECUTION_PLAN_SYSTEM_PROMPT.to_string())
         .allowed_tools(vec!["Read".to_string()])
         .permission_mode(claude_agent_sdk::PermissionMode::BypassPermissions)
         .build();
@@ -128,16 +156,10 @@ pub fn parse_execution_plan(
     execution_plan_yaml: &str,
     tasks: &[Value],
 ) -> Result<Vec<Vec<Value>>> {
-    let plan: Value = serde_yaml::from_str(execution_plan_yaml)
+    let plan: Value = parse_yaml(execution_plan_yaml)
         .context("Failed to parse execution plan YAML")?;
 
-    // Build task lookup by ID
-    let mut task_map: HashMap<u32, Value> = HashMap::new();
-    for task in tasks {
-        if let Some(task_id) = get_task_id(task) {
-            task_map.insert(task_id, task.clone());
-        }
-    }
+    let mut task_index = index_tasks_by_id(tasks);
 
     // Extract batches from plan
     let mut batches = Vec::new();
@@ -159,8 +181,8 @@ pub fn parse_execution_plan(
 
         for task_ref in task_refs {
             if let Some(task_id) = task_ref.get("task_id").and_then(|id| id.as_u64()) {
-                if let Some(task) = task_map.remove(&(task_id as u32)) {
-                    batch.push(task);
+                if let Some(index) = task_index.remove(&(task_id as u32)) {
+                    batch.push(tasks[index].clone());
                 }
             }
         }
@@ -174,78 +196,114 @@ pub fn parse_execution_plan(
 }
 
 /// Fallback: Simple dependency analysis if execution plan fails
+///
+/// Layers the tasks with Kahn's algorithm: each batch holds every task whose
+/// dependencies all sit in earlier batches, in O(tasks + dependencies).
+/// Dependencies on IDs that are not in `tasks` are ignored; tasks left on a
+/// cycle go into one final batch.
 pub fn build_execution_batches_fallback(tasks: &[Value]) -> Vec<Vec<Value>> {
     println!("Using fallback dependency analysis");
 
-    // Build task lookup by ID
-    let mut task_map: HashMap<u32, Value> = HashMap::new();
-    for task in tasks {
-        if let Some(task_id) = get_task_id(task) {
-            task_map.insert(task_id, task.clone());
+    let task_index = index_tasks_by_id(tasks);
+
+    // Count each task's unmet dependencies and record who waits on whom
+    let mut pending = vec![0usize; tasks.len()];
+    let mut dependents: Vec<Vec<usize>> = vec![Vec::new(); tasks.len()];
+    let mut ready = Vec::new();
+    for (i, task) in tasks.iter().enumerate() {
+        if get_task_id(task).is_none() {
+            continue;
+        }
+        for dep in get_task_dependencies(task) {
+            if let Some(&dep_index) = task_index.get(&dep) {
+                pending[i] += 1;
+                dependents[dep_index].push(i);
+            }
+        }
+        if pending[i] == 0 {
+            ready.push(i);
         }
     }
 
-    // Track which tasks have been scheduled
-    let mut scheduled = std::collections::HashSet::new();
     let mut batches = Vec::new();
+    while !ready.is_empty() {
+        let mut next = Vec::new();
+        for &i in &ready {
+            for &dependent in &dependents[i] {
+                pending[dependent] -= 1;
+                if pending[dependent] == 0 {
+                    next.push(dependent);
+                }
+            }
+        }
+        // Keep the overview's task order within a batch
+        next.sort_unstable();
 
-    while scheduled.len() < tasks.len() {
-        let mut current_batch = Vec::new();
+        batches.push(ready.iter().map(|&i| tasks[i].clone()).collect());
+        ready = next;
+    }
 
-        for task in tasks {
-            let task_id = match get_task_id(task) {
-                Some(id) => id,
-                None => continue,
-            };
+    let remaining: Vec<Value> = (0..tasks.len())
+        .filter(|&i| pending[i] > 0)
+        .map(|i| tasks[i].clone())
+        .collect();
+    if !remaining.is_empty() {
+        // Circular dependency - add remaining tasks
+        println!("Warning: Circular dependency detected or unresolved dependencies");
+        batches.push(remaining);
+    }
 
-            if scheduled.contains(&task_id) {
-                continue;
-            }
+    batches
+}
 
-            // Check if all dependencies are satisfied
-            let dependencies = task
-                .get("task")
-                .and_then(|t| t.get("dependencies"))
-                .and_then(|d| d.get("requires_completion_of"))
-                .and_then(|r| r.as_sequence());
-
-            let can_run = match dependencies {
-                None => true,
-                Some(deps) if deps.is_empty() => true,
-                Some(deps) => deps.iter().all(|dep| {
-                    dep.get("task_id")
-                        .and_then(|id| id.as_u64())
-                        .map(|id| scheduled.contains(&(id as u32)))
-                        .unwrap_or(true)
-                }),
-            };
-
-            if can_run {
-                current_batch.push(task.clone());
-                scheduled.insert(task_id);
-            }
-        }
+/// Map each task ID to the position of its task in `tasks`
+fn index_tasks_by_id(tasks: &[Value]) -> HashMap<u32, usize> {
+    tasks
+        .iter()
+        .enumerate()
+        .filter_map(|(i, task)| Some((get_task_id(task)?, i)))
+        .collect()
+}
 
-        if current_batch.is_empty() {
-            // Circular dependency or error - add remaining tasks
-            println!("Warning: Circular dependency detected or unresolved dependencies");
-            let remaining: Vec<Value> = tasks
-                .iter()
-                .filter(|t| {
-                    get_task_id(t)
-                        .map(|id| !scheduled.contains(&id))
-                        .unwrap_or(false)
-                })
-                .cloned()
-                .collect();
-            if !remaining.is_empty() {
-                batches.push(remaining);
-            }
-            break;
-        }
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn task(id: u32, deps: &[u32]) -> Value {
+        let deps: Vec<String> = deps.iter().map(|d| format!("{{task_id: {}}}", d)).collect();
+        serde_yaml::from_str(&format!(
+            "task: {{id: {}, name: t{}, dependencies: {{requires_completion_of: [{}]}}}}",
+            id,
+            id,
+            deps.join(", ")
+        ))
+        .unwrap()
+    }
 
-        batches.push(current_batch);
+    fn batch_ids(batches: &[Vec<Value>]) -> Vec<Vec<u32>> {
+        batches
+            .iter()
+            .map(|batch| batch.iter().filter_map(get_task_id).collect())
+            .collect()
     }
 
-    batches
+    #[test]
+    fn test_fallback_batches_follow_dependencies() {
+        // 3 depends on 1 even though it is listed before it; 99 does not exist
+        let tasks = vec![
+            task(3, &[1]),
+            task(1, &[]),
+            task(2, &[99]),
+            task(4, &[3, 2]),
+        ];
+        let batches = build_execution_batches_fallback(&tasks);
+        assert_eq!(batch_ids(&batches), vec![vec![1, 2], vec![3], vec![4]]);
+    }
+
+    #[test]
+    fn test_fallback_puts_cycle_in_last_batch() {
+        let tasks = vec![task(1, &[]), task(2, &[3]), task(3, &[2])];
+        let batches = build_execution_batches_fallback(&tasks);
+        assert_eq!(batch_ids(&batches), vec![vec![1], vec![2, 3]]);
+    }
 }
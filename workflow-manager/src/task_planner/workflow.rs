@@ -3,12 +3,27 @@
 use crate::task_planner::cli::Args;
 use crate::task_planner::{phase0_overview, phase1_expand, phase2_review};
 use anyhow::{Context, Result};
+use futures::future::try_join_all;
 use std::path::PathBuf;
 use tokio::fs;
 use workflow_manager_sdk::{
     log_phase_complete, log_phase_start, log_state_file, log_task_complete, log_task_start,
 };
 
+/// Read a file the first time it is needed and reuse the contents afterwards
+///
+/// IMPL.md and the task template are needed by more than one phase; this
+/// keeps a run from reading them again for every phase that uses them.
+async fn read_cached<'a>(cache: &'a mut Option<String>, path: &str, what: &str) -> Result<&'a str> {
+    let content = match cache.take() {
+        Some(content) => content,
+        None => fs::read_to_string(path)
+            .await
+            .with_context(|| format!("Failed to read {}: {}", what, path))?,
+    };
+    Ok(cache.insert(content))
+}
+
 /// Main workflow function that orchestrates all phases
 pub async fn run_workflow(args: Args) -> Result<()> {
     // Validate arguments
@@ -48,6 +63,13 @@ pub async fn run_workflow(args: Args) -> Result<()> {
     let mut tasks_yaml = String::new();
     let mut task_files: Vec<PathBuf> = Vec::new();
 
+    // With --cache, agent responses are cached next to the outputs
+    let cache_dir = args.cache.then(|| output_dir.join(".cache"));
+
+    // Inputs shared between phases, read on first use
+    let mut impl_md_cache: Option<String> = None;
+    let mut task_template_cache: Option<String> = None;
+
     // Phase 0: Generate overview
     if phases.contains(&0) {
         log_phase_start!(0, "Generate Task Overview", 3);
@@ -58,22 +80,25 @@ pub async fn run_workflow(args: Args) -> Result<()> {
         );
 
         let impl_file = args.impl_file.as_ref().unwrap();
-        let impl_md = fs::read_to_string(impl_file)
-            .await
-            .with_context(|| format!("Failed to read IMPL file: {}", impl_file))?;
-
         let overview_template_path = args.overview_template.as_ref().unwrap();
-        let overview_template = fs::read_to_string(overview_template_path)
-            .await
-            .with_context(|| {
-                format!(
-                    "Failed to read overview template: {}",
-                    overview_template_path
-                )
-            })?;
+
+        // Independent reads, issue them together
+        let (impl_md, overview_template) = tokio::try_join!(
+            read_cached(&mut impl_md_cache, impl_file, "IMPL file"),
+            async {
+                fs::read_to_string(overview_template_path)
+                    .await
+                    .with_context(|| {
+                        format!(
+                            "Failed to read overview template: {}",
+                            overview_template_path
+                        )
+                    })
+            },
+        )?;
 
         tasks_overview_yaml =
-            phase0_overview::generate_overview(&impl_md, &overview_template).await?;
+            phase0_overview::generate_overview(impl_md, &overview_template).await?;
 
         // Save to file
         let timestamp = chrono::Local::now().format("%Y%m%d_%H%M%S");
@@ -100,21 +125,23 @@ pub async fn run_workflow(args: Args) -> Result<()> {
         log_phase_start!(1, "Expand Tasks", 3);
 
         let task_template_path = args.task_template.as_ref().unwrap();
-        let task_template = fs::read_to_string(task_template_path)
-            .await
-            .with_context(|| {
-                format!("Failed to read task template: {}", task_template_path)
-            })?;
+        let task_template = read_cached(
+            &mut task_template_cache,
+            task_template_path,
+            "task template",
+        )
+        .await?;
 
         let timestamp = chrono::Local::now().format("%Y%m%d_%H%M%S").to_string();
 
         task_files = phase1_expand::expand_tasks(
             &tasks_overview_yaml,
-            &task_template,
+            task_template,
             args.simple_batching,
-            args.batch_size,
+            args.expand_batch_size(),
             &output_dir,
             &timestamp,
+            cache_dir.as_deref(),
         )
         .await?;
 
@@ -136,21 +163,24 @@ pub async fn run_workflow(args: Args) -> Result<()> {
                 .await
                 .with_context(|| format!("Failed to read directory: {}", tasks_path))?;
 
-            let mut task_yamls = Vec::new();
-
             while let Some(entry) = entries.next_entry().await? {
                 let path = entry.path();
                 if let Some(name) = path.file_name() {
                     let name_str = name.to_string_lossy();
                     if name_str.starts_with("task_") && name_str.ends_with(".yaml") {
-                        let content = fs::read_to_string(&path)
-                            .await
-                            .with_context(|| format!("Failed to read task file: {}", path.display()))?;
-                        task_yamls.push(content);
                         task_files.push(path);
                     }
                 }
             }
+            task_files.sort();
+
+            // Read all task files concurrently rather than one await at a time
+            let task_yamls = try_join_all(task_files.iter().map(|path| async move {
+                fs::read_to_string(path)
+                    .await
+                    .with_context(|| format!("Failed to read task file: {}", path.display()))
+            }))
+            .await?;
 
             tasks_yaml = task_yamls.join("\n---\n");
             println!("Loaded {} task files from directory: {}", task_files.len(), tasks_path);
@@ -168,23 +198,26 @@ pub async fn run_workflow(args: Args) -> Result<()> {
         log_phase_start!(2, "Review Tasks", 3);
 
         let impl_file = args.impl_file.as_ref().unwrap();
-        let impl_md = fs::read_to_string(impl_file)
-            .await
-            .with_context(|| format!("Failed to read IMPL file: {}", impl_file))?;
-
         let task_template_path = args.task_template.as_ref().unwrap();
-        let task_template = fs::read_to_string(task_template_path)
-            .await
-            .with_context(|| {
-                format!("Failed to read task template: {}", task_template_path)
-            })?;
+
+        // Either may already be cached by an earlier phase; read the rest together
+        let (impl_md, task_template) = tokio::try_join!(
+            read_cached(&mut impl_md_cache, impl_file, "IMPL file"),
+            read_cached(
+                &mut task_template_cache,
+                task_template_path,
+                "task template"
+            ),
+        )?;
 
         phase2_review::review_tasks(
             &tasks_overview_yaml,
             &tasks_yaml,
-            &impl_md,
-            &task_template,
+            impl_md,
+            task_template,
             args.batch_size,
+            args.target_tokens_per_batch,
+            cache_dir.as_deref(),
         )
         .await?;
 
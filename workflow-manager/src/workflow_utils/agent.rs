@@ -3,9 +3,18 @@
 use anyhow::Result;
 use claude_agent_sdk::{query, ClaudeAgentOptions, ContentBlock, Message};
 use futures::{Stream, StreamExt};
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::path::{Path, PathBuf};
+use std::time::Duration;
 use workflow_manager_sdk::{log_agent_complete, log_agent_failed, log_agent_message, log_agent_start};
 
+/// Age after which a cached response is ignored. Agents read the working
+/// tree, whose contents the cache key does not cover, so entries must not
+/// live forever.
+const CACHE_TTL: Duration = Duration::from_secs(7 * 24 * 60 * 60);
+
 /// Configuration for agent execution
 pub struct AgentConfig {
     /// Task ID this agent belongs to
@@ -18,6 +27,8 @@ pub struct AgentConfig {
     pub prompt: String,
     /// Claude agent options (system prompt, tools, sub-agents, etc.)
     pub options: ClaudeAgentOptions,
+    /// File the response is cached in, see [`AgentConfig::with_cache`]
+    pub cache_file: Option<PathBuf>,
 }
 
 impl AgentConfig {
@@ -35,8 +46,34 @@ impl AgentConfig {
             description: description.into(),
             prompt: prompt.into(),
             options,
+            cache_file: None,
         }
     }
+
+    /// Look the response up in a disk cache under `cache_dir`
+    ///
+    /// The file name is a hash of the prompt, the crate version, the working
+    /// directory and `fingerprint`, which should cover everything else that
+    /// shapes the response (system prompt, sub-agent definitions, embedded
+    /// documents). A later run with the same inputs returns the stored
+    /// response without querying the agent, as long as the entry is younger
+    /// than a week. Edits to files the agent reads are not part of the key.
+    ///
+    /// [`execute_agent`] only reads the cache. Callers store a response with
+    /// [`store_cached_response`] once they have checked it is usable, so a
+    /// malformed reply is never replayed.
+    ///
+    /// `DefaultHasher` output may change between toolchains; that only costs
+    /// a cache miss.
+    pub fn with_cache(mut self, cache_dir: &Path, fingerprint: impl Hash) -> Self {
+        let mut hasher = DefaultHasher::new();
+        env!("CARGO_PKG_VERSION").hash(&mut hasher);
+        self.prompt.hash(&mut hasher);
+        std::env::current_dir().ok().hash(&mut hasher);
+        fingerprint.hash(&mut hasher);
+        self.cache_file = Some(cache_dir.join(format!("{:016x}.txt", hasher.finish())));
+        self
+    }
 }
 
 /// Execute a sub-orchestrator agent with automatic stream handling
@@ -47,7 +84,9 @@ impl AgentConfig {
 /// - Sub-agent delegation detection
 /// - Text, tool use, and tool result logging
 ///
-/// Returns the full response text collected from all Text blocks.
+/// Returns the full response text collected from all Text blocks. With a
+/// cache file set, a fresh cached response is returned instead of querying
+/// the agent; new responses are not stored, see [`store_cached_response`].
 ///
 /// # Example
 /// ```rust
@@ -59,6 +98,7 @@ impl AgentConfig {
 ///     options: ClaudeAgentOptions::builder()
 ///         .system_prompt("You are a researcher...")
 ///         .build(),
+///     cache_file: None,
 /// };
 ///
 /// let response = execute_agent(config).await?;
@@ -66,6 +106,13 @@ impl AgentConfig {
 pub async fn execute_agent(config: AgentConfig) -> Result<String> {
     log_agent_start!(&config.task_id, &config.agent_name, &config.description);
 
+    if let Some(cache_file) = &config.cache_file {
+        if let Some(response) = load_cached_response(cache_file).await {
+            log_agent_complete!(&config.task_id, &config.agent_name, "Completed (cached)");
+            return Ok(response);
+        }
+    }
+
     // Query Claude
     let stream = query(&config.prompt, Some(config.options))
         .await
@@ -87,6 +134,51 @@ pub async fn execute_agent(config: AgentConfig) -> Result<String> {
     }
 }
 
+/// Read a cached response, unless it is missing or older than [`CACHE_TTL`]
+async fn load_cached_response(cache_file: &Path) -> Option<String> {
+    let modified = tokio::fs::metadata(cache_file)
+        .await
+        .ok()?
+        .modified()
+        .ok()?;
+    if modified.elapsed().map_or(true, |age| age > CACHE_TTL) {
+        return None;
+    }
+    tokio::fs::read_to_string(cache_file).await.ok()
+}
+
+/// Store a validated response in the cache file set by
+/// [`AgentConfig::with_cache`]
+///
+/// A fresh entry that already holds this response is left alone, so replayed
+/// responses do not extend their own lifetime. Failures are only reported;
+/// the cache is an optimization.
+pub async fn store_cached_response(cache_file: &Path, response: &str) {
+    if load_cached_response(cache_file).await.as_deref() == Some(response) {
+        return;
+    }
+    if let Err(e) = write_cache_file(cache_file, response).await {
+        println!("Warning: Failed to cache agent response: {:#}", e);
+    }
+}
+
+/// Remove a cache entry whose response turned out to be unusable
+pub async fn discard_cached_response(cache_file: &Path) {
+    let _ = tokio::fs::remove_file(cache_file).await;
+}
+
+/// Write a cache entry via a temporary file so that an interrupted run never
+/// leaves a truncated entry behind
+async fn write_cache_file(cache_file: &Path, response: &str) -> Result<()> {
+    if let Some(dir) = cache_file.parent() {
+        tokio::fs::create_dir_all(dir).await?;
+    }
+    let tmp_file = cache_file.with_extension("tmp");
+    tokio::fs::write(&tmp_file, response).await?;
+    tokio::fs::rename(&tmp_file, cache_file).await?;
+    Ok(())
+}
+
 /// Tracks active sub-agent delegations
 struct DelegationTracker {
     active: HashMap<String, String>,
@@ -276,7 +368,8 @@ async fn handle_stream(
     task_id: &str,
     agent_name: &str,
 ) -> Result<String> {
-    let mut response_text = String::new();
+    // Agent responses are usually several KiB, skip the first few regrowths
+    let mut response_text = String::with_capacity(8 * 1024);
     let mut stream = Box::pin(stream);
     let mut delegations = DelegationTracker::new();
 
@@ -286,7 +379,8 @@ async fn handle_stream(
                 for block in &message.content {
                     match block {
                         ContentBlock::Text { text } => {
-                            // Print to stdout
+                            // Print to stdout. Each block is a whole message,
+                            // so it is shown as soon as it arrives.
                             println!("{}", text);
                             // Log to TUI
                             log_agent_message!(task_id, agent_name, text);
@@ -341,6 +435,22 @@ async fn handle_stream(
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_with_cache_keys_on_prompt_and_fingerprint() {
+        let cache_dir = Path::new("/tmp/cache");
+        let config = |prompt: &str, fingerprint: &str| {
+            AgentConfig::new("t", "a", "d", prompt, ClaudeAgentOptions::builder().build())
+                .with_cache(cache_dir, fingerprint)
+                .cache_file
+                .unwrap()
+        };
+
+        assert_eq!(config("p", "f"), config("p", "f"));
+        assert_ne!(config("p", "f"), config("p", "g"));
+        assert_ne!(config("p", "f"), config("q", "f"));
+        assert!(config("p", "f").starts_with(cache_dir));
+    }
+
     #[test]
     fn test_extract_subagent_name_explicit() {
         let input = serde_json::json!({
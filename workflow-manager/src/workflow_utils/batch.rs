@@ -2,6 +2,7 @@
 
 use anyhow::{anyhow, Result};
 use futures::{stream::FuturesUnordered, Future, StreamExt};
+use std::collections::VecDeque;
 use std::pin::Pin;
 use std::sync::Arc;
 use tokio::sync::Semaphore;
@@ -26,7 +27,8 @@ pub struct TaskContext {
 /// - `task_executor`: Function that processes each item, receives (item, context)
 ///
 /// # Returns
-/// Vector of results in order of completion (not input order)
+/// Vector of results in input order. Tasks still start as soon as a slot
+/// frees, so ordering costs no concurrency.
 ///
 /// # Error Handling
 /// Fails fast - if any task fails, execution stops and error is returned
@@ -58,7 +60,7 @@ where
     let total = items.len();
     let sem = Arc::new(Semaphore::new(batch_size));
     let executor = Arc::new(task_executor);
-    let mut tasks = FuturesUnordered::new();
+    let tasks = FuturesUnordered::new();
 
     // Push all tasks to FuturesUnordered with semaphore control
     for (idx, item) in items.into_iter().enumerate() {
@@ -79,18 +81,13 @@ where
                 .await
                 .map_err(|_| anyhow!("Semaphore closed"))?;
 
-            // Execute task
-            executor(item, ctx).await
+            // Execute task, tagging the result with its input position
+            executor(item, ctx).await.map(|result| (idx, result))
         });
     }
 
     // Collect results as they complete (fail-fast on first error)
-    let mut results = Vec::new();
-    while let Some(result) = tasks.next().await {
-        results.push(result?);
-    }
-
-    Ok(results)
+    collect_in_input_order(tasks, total).await
 }
 
 /// Execute items in parallel batches (boxed future version for complex closures)
@@ -110,7 +107,7 @@ where
     let total = items.len();
     let sem = Arc::new(Semaphore::new(batch_size));
     let executor = Arc::new(task_executor);
-    let mut tasks = FuturesUnordered::new();
+    let tasks = FuturesUnordered::new();
 
     for (idx, item) in items.into_iter().enumerate() {
         let sem = sem.clone();
@@ -129,16 +126,127 @@ where
                 .await
                 .map_err(|_| anyhow!("Semaphore closed"))?;
 
-            executor(item, ctx).await
+            executor(item, ctx).await.map(|result| (idx, result))
         });
     }
 
-    let mut results = Vec::new();
+    collect_in_input_order(tasks, total).await
+}
+
+/// Execute items as a dependency graph with concurrency control
+///
+/// `dependencies[i]` lists the indices of the items that must finish before
+/// item `i` may start; indices out of range are ignored. An item starts as
+/// soon as its own dependencies are done and a slot is free, rather than
+/// waiting for a whole batch level to drain.
+///
+/// # Arguments
+/// - `phase`: Phase number for context
+/// - `items`: Items to process
+/// - `dependencies`: Per-item indices of prerequisite items
+/// - `max_concurrent`: Maximum concurrent tasks
+/// - `task_executor`: Function that processes each item, receives (item, context)
+///
+/// # Returns
+/// Vector of results in input order
+///
+/// # Error Handling
+/// Fails fast like [`execute_batch`]. Returns an error if a dependency cycle
+/// leaves items that can never start.
+pub async fn execute_dag<T, F, Fut, R>(
+    phase: usize,
+    items: Vec<T>,
+    dependencies: Vec<Vec<usize>>,
+    max_concurrent: usize,
+    task_executor: F,
+) -> Result<Vec<R>>
+where
+    T: Send + 'static,
+    R: Send + 'static,
+    F: Fn(T, TaskContext) -> Fut + Send + Sync + 'static,
+    Fut: Future<Output = Result<R>> + Send + 'static,
+{
+    let total = items.len();
+    let max_concurrent = max_concurrent.max(1);
+    let mut items: Vec<Option<T>> = items.into_iter().map(Some).collect();
+
+    // Count unfinished prerequisites per item and who waits on each item
+    let mut pending = vec![0usize; total];
+    let mut dependents: Vec<Vec<usize>> = vec![Vec::new(); total];
+    for (idx, deps) in dependencies.iter().enumerate().take(total) {
+        for &dep in deps {
+            if dep < total && dep != idx {
+                pending[idx] += 1;
+                dependents[dep].push(idx);
+            }
+        }
+    }
+
+    let mut ready: VecDeque<usize> = (0..total).filter(|&idx| pending[idx] == 0).collect();
+    let mut running = FuturesUnordered::new();
+    let mut slots: Vec<Option<R>> = std::iter::repeat_with(|| None).take(total).collect();
+    let mut finished = 0;
+
+    loop {
+        // Start every ready item that fits under the concurrency limit
+        while running.len() < max_concurrent {
+            let Some(idx) = ready.pop_front() else {
+                break;
+            };
+            let Some(item) = items[idx].take() else {
+                continue;
+            };
+
+            let ctx = TaskContext {
+                phase,
+                task_number: idx + 1,
+                total_tasks: total,
+            };
+            let task = task_executor(item, ctx);
+            running.push(async move { task.await.map(|result| (idx, result)) });
+        }
+
+        let Some(result) = running.next().await else {
+            break;
+        };
+        let (idx, value) = result?;
+        slots[idx] = Some(value);
+        finished += 1;
+
+        for &dependent in &dependents[idx] {
+            pending[dependent] -= 1;
+            if pending[dependent] == 0 {
+                ready.push_back(dependent);
+            }
+        }
+    }
+
+    if finished < total {
+        return Err(anyhow!(
+            "Dependency cycle: {} of {} task(s) could never start",
+            total - finished,
+            total
+        ));
+    }
+
+    Ok(slots.into_iter().flatten().collect())
+}
+
+/// Drain completed tasks into their input slots, failing fast on the first error
+async fn collect_in_input_order<R, Fut>(
+    mut tasks: FuturesUnordered<Fut>,
+    total: usize,
+) -> Result<Vec<R>>
+where
+    Fut: Future<Output = Result<(usize, R)>>,
+{
+    let mut slots: Vec<Option<R>> = std::iter::repeat_with(|| None).take(total).collect();
     while let Some(result) = tasks.next().await {
-        results.push(result?);
+        let (idx, value) = result?;
+        slots[idx] = Some(value);
     }
 
-    Ok(results)
+    Ok(slots.into_iter().flatten().collect())
 }
 
 #[cfg(test)]
@@ -161,11 +269,67 @@ mod tests {
         ).await.unwrap();
 
         assert_eq!(results.len(), 5);
-        // Results may not be in order
         assert!(results.contains(&2));
         assert!(results.contains(&10));
     }
 
+    #[tokio::test]
+    async fn test_execute_batch_preserves_input_order() {
+        let items = vec![30, 10, 20, 0];
+
+        // Later items finish first, results still come back in input order
+        let results = execute_batch(1, items, 4, |delay_ms, _ctx| async move {
+            tokio::time::sleep(std::time::Duration::from_millis(delay_ms)).await;
+            Ok(delay_ms)
+        })
+        .await
+        .unwrap();
+
+        assert_eq!(results, vec![30, 10, 20, 0]);
+    }
+
+    #[tokio::test]
+    async fn test_execute_dag_respects_dependencies() {
+        let finished = Arc::new(std::sync::Mutex::new(Vec::new()));
+        let log = finished.clone();
+
+        // 0 is slow and only 2 depends on it, so 1 and 3 finish before 2 starts
+        let items = vec![(0, 30), (1, 0), (2, 0), (3, 0)];
+        let dependencies = vec![vec![], vec![], vec![0], vec![1]];
+
+        let results = execute_dag(1, items, dependencies, 4, move |(id, delay_ms), _ctx| {
+            let log = log.clone();
+            async move {
+                tokio::time::sleep(std::time::Duration::from_millis(delay_ms)).await;
+                log.lock().unwrap().push(id);
+                Ok(id)
+            }
+        })
+        .await
+        .unwrap();
+
+        assert_eq!(results, vec![0, 1, 2, 3]);
+        let order = finished.lock().unwrap().clone();
+        let pos = |id| order.iter().position(|&x| x == id).unwrap();
+        assert!(pos(0) < pos(2));
+        assert!(pos(1) < pos(3));
+        assert!(pos(3) < pos(2));
+    }
+
+    #[tokio::test]
+    async fn test_execute_dag_detects_cycle() {
+        let result = execute_dag(
+            1,
+            vec![1, 2],
+            vec![vec![1], vec![0]],
+            2,
+            |item, _ctx| async move { Ok(item) },
+        )
+        .await;
+
+        assert!(result.unwrap_err().to_string().contains("Dependency cycle"));
+    }
+
     #[tokio::test]
     async fn test_execute_batch_fail_fast() {
         let items = vec![1, 2, 3, 4, 5];
@@ -12,7 +12,10 @@ pub mod task;
 pub mod yaml;
 
 // Re-export commonly used types and functions
-pub use agent::{execute_agent, AgentConfig};
-pub use batch::{execute_batch, TaskContext};
+pub use agent::{discard_cached_response, execute_agent, store_cached_response, AgentConfig};
+pub use batch::{execute_batch, execute_dag, TaskContext};
 pub use task::execute_task;
-pub use yaml::{clean_yaml, extract_yaml, parse_yaml, parse_yaml_multi, validate_yaml_syntax};
+pub use yaml::{
+    clean_yaml, extract_yaml, iter_yaml_documents, parse_yaml, parse_yaml_multi,
+    validate_yaml_documents, validate_yaml_syntax,
+};
@@ -2,6 +2,7 @@
 
 use anyhow::{Context, Result};
 use serde::de::DeserializeOwned;
+use serde::Deserialize;
 
 /// Extract YAML content from markdown code blocks or raw text
 ///
@@ -11,28 +12,26 @@ use serde::de::DeserializeOwned;
 /// - Raw YAML text
 /// - Removes leading document separator (---)
 pub fn extract_yaml(text: &str) -> String {
-    let yaml = if text.contains("```yaml") {
-        // Extract from ```yaml block
-        let yaml_start = text.find("```yaml").unwrap() + 7;
-        let yaml_end = text[yaml_start..]
-            .rfind("```")
-            .map(|pos| pos + yaml_start)
-            .unwrap_or(text.len());
-        text[yaml_start..yaml_end].trim().to_string()
-    } else if text.contains("```") {
-        // Extract from generic ``` block
-        let yaml_start = text.find("```").unwrap() + 3;
-        let yaml_end = text[yaml_start..]
-            .rfind("```")
-            .map(|pos| pos + yaml_start)
-            .unwrap_or(text.len());
-        text[yaml_start..yaml_end].trim().to_string()
-    } else {
+    // Locate the opening fence with a single search per fence kind instead of
+    // a contains() probe followed by a second find()
+    let yaml_start = text
+        .find("```yaml")
+        .map(|pos| pos + 7)
+        .or_else(|| text.find("```").map(|pos| pos + 3));
+
+    let yaml = match yaml_start {
+        Some(yaml_start) => {
+            let yaml_end = text[yaml_start..]
+                .rfind("```")
+                .map(|pos| pos + yaml_start)
+                .unwrap_or(text.len());
+            &text[yaml_start..yaml_end]
+        }
         // Assume raw YAML
-        text.trim().to_string()
+        None => text,
     };
 
-    clean_yaml(&yaml)
+    clean_yaml(yaml.trim())
 }
 
 /// Clean YAML by removing document separators and normalizing whitespace
@@ -51,46 +50,54 @@ pub fn clean_yaml(yaml: &str) -> String {
 /// - Syntax error hints
 /// - Preview of problematic content
 pub fn parse_yaml<T: DeserializeOwned>(yaml: &str) -> Result<T> {
-    serde_yaml::from_str(yaml).context("Failed to parse YAML").map_err(|e| {
-        let error_msg = format!("YAML parsing error: {}", e);
-
-        // Provide additional context for common errors
-        if error_msg.contains("duplicate") {
-            eprintln!("\n❌ YAML PARSING ERROR: Duplicate keys detected");
-            eprintln!("The YAML contains duplicate keys which is invalid.");
-            eprintln!("\nYAML preview (first 500 chars):");
-            eprintln!("{}", &yaml.chars().take(500).collect::<String>());
-        } else if error_msg.contains("expected") {
-            eprintln!("\n❌ YAML SYNTAX ERROR");
-            eprintln!("{}", e);
-            eprintln!("\nYAML preview (first 500 chars):");
-            eprintln!("{}", &yaml.chars().take(500).collect::<String>());
-        }
+    serde_yaml::from_str(yaml)
+        .map_err(|e| {
+            // Inspect the serde_yaml error itself; once wrapped in context the
+            // message no longer carries the underlying cause.
+            let error_msg = e.to_string();
+
+            // Provide additional context for common errors
+            if error_msg.contains("duplicate") {
+                eprintln!("\n❌ YAML PARSING ERROR: Duplicate keys detected");
+                eprintln!("The YAML contains duplicate keys which is invalid.");
+                eprintln!("\nYAML preview (first 500 chars):");
+                eprintln!("{}", &yaml.chars().take(500).collect::<String>());
+            } else if error_msg.contains("expected") {
+                eprintln!("\n❌ YAML SYNTAX ERROR");
+                eprintln!("{}", e);
+                eprintln!("\nYAML preview (first 500 chars):");
+                eprintln!("{}", &yaml.chars().take(500).collect::<String>());
+            }
+
+            e
+        })
+        .context("Failed to parse YAML")
+}
 
-        e.into()
-    })
+/// Iterate over the documents of a multi-document YAML stream
+///
+/// Documents are parsed lazily, one at a time, by a single serde_yaml parser,
+/// so callers can consume them without collecting the whole stream first.
+/// Empty documents are skipped.
+pub fn iter_yaml_documents<'a, T: DeserializeOwned + 'a>(
+    text: &'a str,
+) -> impl Iterator<Item = Result<T>> + 'a {
+    serde_yaml::Deserializer::from_str(text)
+        .enumerate()
+        .filter_map(|(idx, document)| {
+            Option::<T>::deserialize(document)
+                .with_context(|| format!("Failed to parse document {}", idx))
+                .transpose()
+        })
 }
 
 /// Parse multi-document YAML (documents separated by ---)
 ///
-/// Each document is parsed independently and returned as a vector.
+/// The whole stream is read by a single serde_yaml parser, so a `---` inside
+/// a block scalar is not mistaken for a document separator.
 /// Empty documents are skipped.
 pub fn parse_yaml_multi<T: DeserializeOwned>(text: &str) -> Result<Vec<T>> {
-    let documents: Vec<&str> = text.split("---").collect();
-    let mut results = Vec::new();
-
-    for (idx, doc) in documents.iter().enumerate() {
-        let doc = doc.trim();
-        if doc.is_empty() {
-            continue;
-        }
-
-        let parsed = parse_yaml::<T>(doc)
-            .with_context(|| format!("Failed to parse document {}", idx))?;
-        results.push(parsed);
-    }
-
-    Ok(results)
+    iter_yaml_documents(text).collect()
 }
 
 /// Validate YAML syntax without parsing into a specific type
@@ -102,10 +109,23 @@ pub fn validate_yaml_syntax(yaml: &str) -> Result<()> {
     Ok(())
 }
 
+/// Validate every document in a (possibly multi-document) YAML stream
+///
+/// Walks the stream with serde_yaml's native parser, so no external
+/// validator process is needed. Returns the number of documents on success.
+pub fn validate_yaml_documents(yaml: &str) -> Result<usize> {
+    let mut count = 0;
+    for (idx, document) in serde_yaml::Deserializer::from_str(yaml).enumerate() {
+        serde_yaml::Value::deserialize(document)
+            .with_context(|| format!("YAML syntax error in document {}", idx + 1))?;
+        count += 1;
+    }
+    Ok(count)
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
-    use serde::Deserialize;
 
     #[derive(Debug, Deserialize, PartialEq)]
     struct TestData {
@@ -145,6 +165,14 @@ count: 42
         assert!(yaml.contains("title: Test"));
     }
 
+    #[test]
+    fn test_extract_yaml_prefers_yaml_fence() {
+        let text = "```\nnot yaml\n```\n\n```yaml\ntitle: Test\n```";
+
+        let yaml = extract_yaml(text);
+        assert_eq!(yaml, "title: Test");
+    }
+
     #[test]
     fn test_extract_yaml_raw() {
         let text = r#"
@@ -192,4 +220,31 @@ count: 2
         assert!(validate_yaml_syntax("title: Test").is_ok());
         assert!(validate_yaml_syntax("invalid: [unclosed").is_err());
     }
+
+    #[test]
+    fn test_validate_yaml_documents() {
+        let yaml = "---\ntitle: First\n---\ntitle: Second\n";
+        assert_eq!(validate_yaml_documents(yaml).unwrap(), 2);
+        assert!(validate_yaml_documents("title: ok\n---\ninvalid: [unclosed").is_err());
+    }
+
+    #[test]
+    fn test_parse_yaml_multi_separator_in_block_scalar() {
+        let yaml = "title: First\nnotes: |\n  above\n  ---\n  below\n---\ntitle: Second\n";
+
+        let docs: Vec<serde_yaml::Value> = parse_yaml_multi(yaml).unwrap();
+        assert_eq!(docs.len(), 2);
+        assert!(docs[0]["notes"].as_str().unwrap().contains("---"));
+        assert_eq!(docs[1]["title"].as_str(), Some("Second"));
+    }
+
+    #[test]
+    fn test_iter_yaml_documents_is_lazy() {
+        // The broken second document is only reached if the iterator is advanced
+        let yaml = "title: First\ncount: 1\n---\ninvalid: [unclosed";
+
+        let mut docs = iter_yaml_documents::<TestData>(yaml);
+        assert_eq!(docs.next().unwrap().unwrap().title, "First");
+        assert!(docs.next().unwrap().is_err());
+    }
 }